@@ -4,16 +4,20 @@ Prevents the screen from going to sleep while the focus timer is running.
 
 Implementations:
     - Windows: ctypes + SetThreadExecutionState
-    - macOS: caffeinate subprocess
-    - Linux: systemd-inhibit or xdg-screensaver reset fallback
+    - macOS: IOKit power assertions via ctypes
+    - Linux: systemd-inhibit plus a held D-Bus Inhibit, with an
+      activity-simulation fallback
 """
 
 import os
 import sys
+import shlex
+import shutil
 import subprocess
 import threading
 import time
 from abc import ABC, abstractmethod
+from functools import cache, lru_cache
 from typing import Optional
 
 
@@ -52,10 +56,20 @@ class WindowsKeepAwake(KeepAwakeBase):
         self._kernel32 = None
         
     def _load_kernel32(self):
-        """Load kernel32.dll if not already loaded."""
+        """Load kernel32.dll and declare the SetThreadExecutionState prototype."""
         if self._kernel32 is None:
             import ctypes
-            self._kernel32 = ctypes.windll.kernel32
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            # EXECUTION_STATE is a DWORD in and out
+            kernel32.SetThreadExecutionState.argtypes = [ctypes.c_uint32]
+            kernel32.SetThreadExecutionState.restype = ctypes.c_uint32
+            self._kernel32 = kernel32
+    
+    def _set_execution_state(self, flags: int):
+        """Call SetThreadExecutionState, raising on failure."""
+        import ctypes
+        if self._kernel32.SetThreadExecutionState(flags) == 0:
+            raise ctypes.WinError(ctypes.get_last_error())
     
     def start(self):
         """Start preventing sleep by setting execution state."""
@@ -65,7 +79,7 @@ class WindowsKeepAwake(KeepAwakeBase):
         try:
             self._load_kernel32()
             # Request the system and display stay on
-            self._kernel32.SetThreadExecutionState(
+            self._set_execution_state(
                 self.ES_CONTINUOUS | 
                 self.ES_SYSTEM_REQUIRED | 
                 self.ES_DISPLAY_REQUIRED
@@ -82,7 +96,7 @@ class WindowsKeepAwake(KeepAwakeBase):
         try:
             self._load_kernel32()
             # Reset to default (allow sleep)
-            self._kernel32.SetThreadExecutionState(self.ES_CONTINUOUS)
+            self._set_execution_state(self.ES_CONTINUOUS)
             self._active = False
         except Exception as e:
             print(f"Warning: Could not disable keep-awake on Windows: {e}")
@@ -93,48 +107,106 @@ class WindowsKeepAwake(KeepAwakeBase):
 
 class MacOSKeepAwake(KeepAwakeBase):
     """
-    macOS implementation using caffeinate subprocess.
-    caffeinate is a built-in macOS utility that prevents sleep.
+    macOS implementation using IOKit power assertions.
+    Calls IOPMAssertionCreateWithName via ctypes, the same mechanism
+    the caffeinate utility uses, without a helper process.
     """
     
+    IOKIT_PATH = '/System/Library/Frameworks/IOKit.framework/IOKit'
+    CORE_FOUNDATION_PATH = (
+        '/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation'
+    )
+    
+    kCFStringEncodingUTF8 = 0x08000100
+    kIOPMAssertionLevelOn = 255
+    kIOReturnSuccess = 0
+    
+    # Equivalent of `caffeinate -d -i`: prevent display and idle sleep
+    ASSERTION_TYPES = ('PreventUserIdleDisplaySleep', 'PreventUserIdleSystemSleep')
+    
     def __init__(self):
-        self._process: Optional[subprocess.Popen] = None
+        self._iokit = None
+        self._cf = None
+        self._assertion_ids: list = []
+    
+    def _load_frameworks(self):
+        """Load IOKit/CoreFoundation and declare the prototypes we call."""
+        if self._iokit is not None:
+            return
+        
+        import ctypes
+        cf = ctypes.cdll.LoadLibrary(self.CORE_FOUNDATION_PATH)
+        cf.CFStringCreateWithCString.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32
+        ]
+        cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+        cf.CFRelease.restype = None
+        
+        iokit = ctypes.cdll.LoadLibrary(self.IOKIT_PATH)
+        iokit.IOPMAssertionCreateWithName.argtypes = [
+            ctypes.c_void_p, ctypes.c_uint32, ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_uint32)
+        ]
+        iokit.IOPMAssertionCreateWithName.restype = ctypes.c_int32
+        iokit.IOPMAssertionRelease.argtypes = [ctypes.c_uint32]
+        iokit.IOPMAssertionRelease.restype = ctypes.c_int32
+        
+        self._cf = cf
+        self._iokit = iokit
+    
+    def _cfstring(self, text: str):
+        """Create a CFString (caller must CFRelease it)."""
+        return self._cf.CFStringCreateWithCString(
+            None, text.encode('utf-8'), self.kCFStringEncodingUTF8
+        )
     
     def start(self):
-        """Start caffeinate subprocess."""
-        if self._process is not None:
+        """Create the power assertions."""
+        if self._assertion_ids:
             return
         
         try:
-            # -d: prevent display sleep
-            # -i: prevent system idle sleep
-            self._process = subprocess.Popen(
-                ['caffeinate', '-d', '-i'],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-        except FileNotFoundError:
-            print("Warning: caffeinate not found on this macOS system")
+            import ctypes
+            self._load_frameworks()
+            
+            reason = self._cfstring('Focus session in progress')
+            try:
+                for assertion_type in self.ASSERTION_TYPES:
+                    type_ref = self._cfstring(assertion_type)
+                    assertion_id = ctypes.c_uint32(0)
+                    try:
+                        result = self._iokit.IOPMAssertionCreateWithName(
+                            type_ref, self.kIOPMAssertionLevelOn,
+                            reason, ctypes.byref(assertion_id)
+                        )
+                    finally:
+                        self._cf.CFRelease(type_ref)
+                    
+                    if result == self.kIOReturnSuccess:
+                        self._assertion_ids.append(assertion_id.value)
+                    else:
+                        print(f"Warning: IOPMAssertionCreateWithName failed: {result:#x}")
+            finally:
+                self._cf.CFRelease(reason)
         except Exception as e:
-            print(f"Warning: Could not start caffeinate: {e}")
+            print(f"Warning: Could not create power assertion: {e}")
     
     def stop(self):
-        """Stop caffeinate subprocess."""
-        if self._process is None:
+        """Release the power assertions."""
+        if not self._assertion_ids:
             return
         
         try:
-            self._process.terminate()
-            self._process.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            self._process.kill()
+            for assertion_id in self._assertion_ids:
+                self._iokit.IOPMAssertionRelease(assertion_id)
         except Exception as e:
-            print(f"Warning: Error stopping caffeinate: {e}")
+            print(f"Warning: Error releasing power assertion: {e}")
         finally:
-            self._process = None
+            self._assertion_ids = []
     
     def is_active(self) -> bool:
-        return self._process is not None and self._process.poll() is None
+        return bool(self._assertion_ids)
 
 
 class LinuxKeepAwake(KeepAwakeBase):
@@ -142,30 +214,49 @@ class LinuxKeepAwake(KeepAwakeBase):
     Linux implementation with multiple strategies for maximum compatibility:
     1. systemd-inhibit (inhibit idle AND sleep)
     2. xset to disable screensaver
-    3. xdg-screensaver reset (periodic)
-    4. Simulate activity with xdotool (if available)
+    3. D-Bus Inhibit on the session bus (via jeepney), held for the session
+    4. Simulate activity with xdotool/dbus-send (only if no inhibitor is held)
     
     Uses multiple methods simultaneously for reliability.
     """
     
+    # Idle inhibitors probed on the session bus: (bus name, object path, interface).
+    # Each exposes Inhibit(application, reason) -> cookie and UnInhibit(cookie).
+    DBUS_INHIBITORS = (
+        ('org.freedesktop.ScreenSaver', '/org/freedesktop/ScreenSaver',
+         'org.freedesktop.ScreenSaver'),
+        ('org.gnome.ScreenSaver', '/org/gnome/ScreenSaver',
+         'org.gnome.ScreenSaver'),
+        ('org.mate.ScreenSaver', '/org/mate/ScreenSaver',
+         'org.mate.ScreenSaver'),
+        ('org.freedesktop.PowerManagement', '/org/freedesktop/PowerManagement/Inhibit',
+         'org.freedesktop.PowerManagement.Inhibit'),
+    )
+    
+    # Fallback activity interval. GNOME/KDE screensavers default to idle
+    # timeouts of 60s or more, so 45s stays safely below the threshold.
+    KEEP_ALIVE_INTERVAL_SECONDS = 45
+    
+    # systemd-inhibit exits at once when logind refuses the lock (no
+    # session, polkit denial, containers); check it is still running
+    # after this long before relying on it
+    INHIBIT_CHECK_SECONDS = 2
+    
     def __init__(self):
         self._process: Optional[subprocess.Popen] = None
         self._keep_alive_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._xset_disabled = False
         self._active = False
+        # Inhibit cookies are only honoured while the connection stays open
+        self._dbus_connection = None
+        self._inhibit_cookies: list = []
     
-    def _check_command_exists(self, command: str) -> bool:
-        """Check if a command exists on the system."""
-        try:
-            result = subprocess.run(
-                ['which', command],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _check_command_exists(command: str) -> bool:
+        """Check if a command exists on the system (cached per process)."""
+        return shutil.which(command) is not None
     
     def _run_command(self, cmd: list, timeout: int = 5) -> bool:
         """Run a command silently, return success status."""
@@ -179,6 +270,80 @@ class LinuxKeepAwake(KeepAwakeBase):
         except Exception:
             return False
     
+    def _dbus_inhibit(self) -> bool:
+        """
+        Inhibit idle through every screensaver/power service on the session bus.
+        
+        Returns:
+            True if at least one service accepted the inhibit request.
+        """
+        try:
+            from jeepney import DBusAddress, new_method_call
+            from jeepney.bus_messages import message_bus
+            from jeepney.io.blocking import open_dbus_connection
+            from jeepney.wrappers import unwrap_msg
+        except ImportError:
+            return False
+        
+        try:
+            self._dbus_connection = open_dbus_connection(bus='SESSION')
+        except Exception as e:
+            print(f"Warning: Could not connect to the D-Bus session bus: {e}")
+            return False
+        
+        for bus_name, path, interface in self.DBUS_INHIBITORS:
+            try:
+                reply = self._dbus_connection.send_and_get_reply(
+                    message_bus.NameHasOwner(bus_name), timeout=5
+                )
+                if not unwrap_msg(reply)[0]:
+                    continue
+                
+                address = DBusAddress(path, bus_name=bus_name, interface=interface)
+                reply = self._dbus_connection.send_and_get_reply(
+                    new_method_call(
+                        address, 'Inhibit', 'ss',
+                        ('FocusTimer', 'Focus session in progress')
+                    ),
+                    timeout=5
+                )
+                cookie = unwrap_msg(reply)[0]
+                self._inhibit_cookies.append((address, cookie))
+            except Exception:
+                continue
+        
+        if not self._inhibit_cookies:
+            self._dbus_close()
+            return False
+        return True
+    
+    def _dbus_uninhibit(self):
+        """Release all held inhibit cookies and close the D-Bus connection."""
+        if self._dbus_connection is None:
+            return
+        
+        from jeepney import new_method_call
+        
+        for address, cookie in self._inhibit_cookies:
+            try:
+                self._dbus_connection.send_and_get_reply(
+                    new_method_call(address, 'UnInhibit', 'u', (cookie,)),
+                    timeout=5
+                )
+            except Exception as e:
+                print(f"Warning: Error releasing D-Bus inhibit: {e}")
+        self._dbus_close()
+    
+    def _dbus_close(self):
+        """Close the D-Bus connection (releases any remaining inhibits)."""
+        self._inhibit_cookies = []
+        if self._dbus_connection is not None:
+            try:
+                self._dbus_connection.close()
+            except Exception:
+                pass
+            self._dbus_connection = None
+    
     def start(self):
         """Start keeping screen awake using all available methods."""
         if self._active:
@@ -186,6 +351,7 @@ class LinuxKeepAwake(KeepAwakeBase):
         
         self._active = True
         self._stop_event.clear()
+        systemd_started = False
         
         # Method 1: Try systemd-inhibit to block idle and sleep
         if self._check_command_exists('systemd-inhibit'):
@@ -202,6 +368,7 @@ class LinuxKeepAwake(KeepAwakeBase):
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL
                 )
+                systemd_started = True
             except Exception as e:
                 print(f"Warning: systemd-inhibit failed: {e}")
         
@@ -216,52 +383,68 @@ class LinuxKeepAwake(KeepAwakeBase):
             except Exception:
                 pass
         
-        # Method 3: Start background thread for periodic resets
+        # Method 3: Hold a D-Bus inhibit for the whole session
+        dbus_ok = self._dbus_inhibit()
+        
+        # A granted D-Bus inhibit holds until released, so no polling is needed
+        if dbus_ok:
+            return
+        
+        # Method 4: Fall back to periodic activity simulation, unless
+        # systemd-inhibit turns out to hold its lock
         self._keep_alive_thread = threading.Thread(
-            target=self._keep_alive_loop, 
+            target=self._keep_alive_loop,
+            args=(systemd_started,),
             daemon=True
         )
         self._keep_alive_thread.start()
     
-    def _keep_alive_loop(self):
+    def _keep_alive_loop(self, check_inhibitor: bool):
         """
-        Periodic loop to keep screen awake using multiple methods.
-        Runs every 30 seconds while active.
+        Fallback loop that simulates user activity when neither
+        systemd-inhibit nor a D-Bus inhibitor could be used.
+        Runs every KEEP_ALIVE_INTERVAL_SECONDS while active;
+        stop() wakes it immediately.
+        
+        Args:
+            check_inhibitor: systemd-inhibit was started; exit without
+                simulating activity if it is still running after
+                INHIBIT_CHECK_SECONDS.
         """
-        has_xdg = self._check_command_exists('xdg-screensaver')
-        has_xdotool = self._check_command_exists('xdotool')
-        has_dbus = self._check_command_exists('dbus-send')
+        if check_inhibitor:
+            if self._stop_event.wait(self.INHIBIT_CHECK_SECONDS):
+                return
+            process = self._process
+            if process is not None and process.poll() is None:
+                return
         
-        while not self._stop_event.is_set():
-            # Method A: Reset xdg-screensaver
-            if has_xdg:
-                self._run_command(['xdg-screensaver', 'reset'])
-            
-            # Method B: Simulate tiny mouse movement with xdotool
-            # This is very effective at preventing sleep
-            if has_xdotool:
-                # Move mouse 0 pixels (just resets idle timer)
-                self._run_command(['xdotool', 'mousemove_relative', '0', '0'])
-            
-            # Method C: Send inhibit signal via D-Bus (GNOME/KDE)
-            if has_dbus:
-                # Try GNOME screensaver inhibit
-                self._run_command([
-                    'dbus-send', '--session', '--type=method_call',
-                    '--dest=org.gnome.ScreenSaver',
-                    '/org/gnome/ScreenSaver',
-                    'org.gnome.ScreenSaver.SimulateUserActivity'
-                ])
-                # Try freedesktop screensaver
-                self._run_command([
+        commands = []
+        
+        # Method A: Simulate tiny mouse movement with xdotool
+        # Move mouse 0 pixels (just resets idle timer)
+        if self._check_command_exists('xdotool'):
+            commands.append(['xdotool', 'mousemove_relative', '0', '0'])
+        
+        # Method B: Send activity signal via D-Bus (GNOME, then freedesktop/KDE)
+        if self._check_command_exists('dbus-send'):
+            for name, path in (
+                ('org.gnome.ScreenSaver', '/org/gnome/ScreenSaver'),
+                ('org.freedesktop.ScreenSaver', '/org/freedesktop/ScreenSaver'),
+            ):
+                commands.append([
                     'dbus-send', '--session', '--type=method_call',
-                    '--dest=org.freedesktop.ScreenSaver',
-                    '/org/freedesktop/ScreenSaver',
-                    'org.freedesktop.ScreenSaver.SimulateUserActivity'
+                    f'--dest={name}', path, f'{name}.SimulateUserActivity'
                 ])
-            
-            # Wait 30 seconds before next reset
-            self._stop_event.wait(30)
+        
+        if not commands:
+            return
+        
+        # Run every method from one shell so each cycle costs a single fork
+        batch = ['sh', '-c', '; '.join(shlex.join(cmd) for cmd in commands)]
+        
+        while not self._stop_event.is_set():
+            self._run_command(batch)
+            self._stop_event.wait(self.KEEP_ALIVE_INTERVAL_SECONDS)
     
     def stop(self):
         """Stop keeping screen awake and restore settings."""
@@ -276,6 +459,9 @@ class LinuxKeepAwake(KeepAwakeBase):
             self._keep_alive_thread.join(timeout=5)
             self._keep_alive_thread = None
         
+        # Release D-Bus inhibits
+        self._dbus_uninhibit()
+        
         # Stop systemd-inhibit process
         if self._process is not None:
             try:
@@ -326,6 +512,8 @@ class KeepAwakeManager:
     keep-awake implementation for the current platform.
     """
     
+    __slots__ = ('_impl', '_enabled')
+    
     def __init__(self):
         """Initialize with platform-appropriate implementation."""
         self._impl = self._create_implementation()
@@ -377,13 +565,7 @@ class KeepAwakeManager:
         self._impl.stop()
 
 
-# Global instance for convenient access
-_keep_awake_manager: Optional[KeepAwakeManager] = None
-
-
+@cache
 def get_keep_awake_manager() -> KeepAwakeManager:
     """Get or create the global KeepAwakeManager instance."""
-    global _keep_awake_manager
-    if _keep_awake_manager is None:
-        _keep_awake_manager = KeepAwakeManager()
-    return _keep_awake_manager
+    return KeepAwakeManager()
@@ -1,11 +1,11 @@
 """
 Data models for the Focus Timer application.
-Uses dataclasses for clean, type-annotated data structures.
+Uses slotted dataclasses for clean, type-annotated data structures.
 """
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional
+from typing import Optional, Tuple
 import time
 
 
@@ -23,7 +23,7 @@ class SessionStatus(Enum):
     INTERRUPTED = "interrupted"
 
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     """
     Represents a category/group for organizing focus sessions.
@@ -44,7 +44,7 @@ class Group:
             self.default_break_minutes = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """
     Represents a focus or break session record.
@@ -74,7 +74,7 @@ class Session:
         return min(100.0, (self.actual_seconds / self.planned_seconds) * 100.0)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimerPreset:
     """Predefined timer configuration."""
     name: str
@@ -86,15 +86,15 @@ class TimerPreset:
 
 
 # Default presets available in the application
-DEFAULT_PRESETS = [
+DEFAULT_PRESETS: Tuple[TimerPreset, ...] = (
     TimerPreset("Classic Pomodoro", 25, 5),
     TimerPreset("Extended Focus", 50, 10),
     TimerPreset("Long Session", 60, 15),
     TimerPreset("Deep Work", 90, 20),
-]
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSettings:
     """Application settings stored in database or config."""
     auto_start_break: bool = True
@@ -105,7 +105,11 @@ class AppSettings:
     log_breaks: bool = False  # Whether to log break sessions
 
 
-@dataclass
+# Zero-padded "00".."99" strings for per-tick time formatting
+_TWO_DIGIT: Tuple[str, ...] = tuple(f"{i:02d}" for i in range(100))
+
+
+@dataclass(slots=True)
 class TimerContext:
     """
     Current timer context containing all state information.
@@ -120,6 +124,11 @@ class TimerContext:
     session_start_ts: int = 0
     pause_start_ts: int = 0
     total_paused_seconds: int = 0
+    # Monotonic clock readings (time.monotonic_ns) used for elapsed-time
+    # math; the *_ts fields stay wall-clock for the saved history
+    session_start_ns: int = 0
+    pause_start_ns: int = 0
+    total_paused_ns: int = 0
 
     @property
     def elapsed_seconds(self) -> int:
@@ -135,6 +144,7 @@ class TimerContext:
 
     def format_remaining(self) -> str:
         """Format remaining time as MM:SS."""
-        minutes = self.remaining_seconds // 60
-        seconds = self.remaining_seconds % 60
-        return f"{minutes:02d}:{seconds:02d}"
+        minutes, seconds = divmod(self.remaining_seconds, 60)
+        if minutes < 100:
+            return _TWO_DIGIT[minutes] + ":" + _TWO_DIGIT[seconds]
+        return f"{minutes}:{_TWO_DIGIT[seconds]}"
@@ -4,19 +4,77 @@ Handles sound playback and desktop notifications on phase changes.
 """
 
 import sys
+import array
+import math
 import struct
-import wave
-import io
-import os
 import subprocess
+from functools import cache, lru_cache
 from typing import Optional
 from pathlib import Path
 
 from PySide6.QtCore import QObject, QUrl, Slot
 from PySide6.QtWidgets import QSystemTrayIcon
 from PySide6.QtGui import QIcon
+from PySide6.QtMultimedia import QSoundEffect
 
 
+def _tone(
+    frequency: int,
+    num_samples: int,
+    fade_samples: int,
+    sample_rate: int,
+    max_amplitude: float
+) -> array.array:
+    """
+    Synthesize a sine tone with linear fade in/out as 16-bit samples.
+    
+    Args:
+        frequency: Frequency of the tone in Hz.
+        num_samples: Length of the tone in samples.
+        fade_samples: Length of each fade ramp in samples.
+        sample_rate: Sample rate in Hz.
+        max_amplitude: Peak sample value.
+    
+    Returns:
+        Samples as a signed 16-bit array.
+    """
+    # Loop-invariant values
+    omega = 2 * math.pi * frequency
+    sin = math.sin
+    fade_samples = max(fade_samples, 1)
+    
+    samples = array.array('h', bytes(2 * num_samples))
+    for i in range(num_samples):
+        # Generate sine wave
+        value = int(max_amplitude * sin(omega * (i / sample_rate)))
+        
+        # Fade in/out to avoid clicks: the envelope ramps up over the first
+        # fade_samples, holds at 1.0, and ramps down over the last ones
+        envelope = min(i, num_samples - i, fade_samples) / fade_samples
+        samples[i] = int(value * envelope)
+    
+    return samples
+
+
+def _pcm_to_wav(samples: array.array, sample_rate: int) -> bytes:
+    """Prefix mono 16-bit samples with a canonical 44-byte PCM WAV header."""
+    # WAV is little-endian
+    if sys.byteorder != 'little':
+        samples.byteswap()
+    data = samples.tobytes()
+    
+    header = struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + len(data), b'WAVE',
+        b'fmt ', 16, 1, 1,            # PCM, mono
+        sample_rate, sample_rate * 2,  # sample rate, byte rate
+        2, 16,                         # block align, bits per sample
+        b'data', len(data)
+    )
+    return header + data
+
+
+@lru_cache(maxsize=None)
 def generate_beep_wav(
     frequency: int = 800,
     duration_ms: int = 200,
@@ -35,108 +93,62 @@ def generate_beep_wav(
     Returns:
         WAV file data as bytes.
     """
-    import math
-    
     num_samples = int(sample_rate * duration_ms / 1000)
-    max_amplitude = 32767 * volume
-    
-    samples = []
-    for i in range(num_samples):
-        # Generate sine wave
-        t = i / sample_rate
-        value = int(max_amplitude * math.sin(2 * math.pi * frequency * t))
-        
-        # Apply fade in/out to avoid clicks
-        fade_samples = int(sample_rate * 0.01)  # 10ms fade
-        if i < fade_samples:
-            value = int(value * (i / fade_samples))
-        elif i > num_samples - fade_samples:
-            value = int(value * ((num_samples - i) / fade_samples))
-        
-        samples.append(struct.pack('<h', value))
-    
-    # Create WAV file in memory
-    buffer = io.BytesIO()
-    with wave.open(buffer, 'wb') as wav:
-        wav.setnchannels(1)  # Mono
-        wav.setsampwidth(2)  # 16-bit
-        wav.setframerate(sample_rate)
-        wav.writeframes(b''.join(samples))
-    
-    return buffer.getvalue()
+    samples = _tone(
+        frequency, num_samples,
+        int(sample_rate * 0.01),  # 10ms fade
+        sample_rate, 32767 * volume
+    )
+    return _pcm_to_wav(samples, sample_rate)
 
 
+@lru_cache(maxsize=None)
 def generate_notification_sound() -> bytes:
     """Generate a pleasant notification sound (two-tone beep)."""
-    import math
-    
     sample_rate = 44100
     max_amplitude = 32767 * 0.4
     
-    samples = []
-    
-    # First tone: 880 Hz for 100ms
-    for i in range(int(sample_rate * 0.1)):
-        t = i / sample_rate
-        value = int(max_amplitude * math.sin(2 * math.pi * 880 * t))
-        # Fade
-        fade_samples = int(sample_rate * 0.01)
-        if i < fade_samples:
-            value = int(value * (i / fade_samples))
-        elif i > int(sample_rate * 0.1) - fade_samples:
-            value = int(value * ((int(sample_rate * 0.1) - i) / fade_samples))
-        samples.append(value)
-    
-    # Short pause: 50ms
-    samples.extend([0] * int(sample_rate * 0.05))
-    
-    # Second tone: 1046 Hz (C6) for 150ms
-    for i in range(int(sample_rate * 0.15)):
-        t = i / sample_rate
-        value = int(max_amplitude * math.sin(2 * math.pi * 1046 * t))
-        # Fade
-        fade_samples = int(sample_rate * 0.015)
-        if i < fade_samples:
-            value = int(value * (i / fade_samples))
-        elif i > int(sample_rate * 0.15) - fade_samples:
-            value = int(value * ((int(sample_rate * 0.15) - i) / fade_samples))
-        samples.append(value)
-    
-    # Create WAV file in memory
-    buffer = io.BytesIO()
-    with wave.open(buffer, 'wb') as wav:
-        wav.setnchannels(1)
-        wav.setsampwidth(2)
-        wav.setframerate(sample_rate)
-        wav.writeframes(struct.pack(f'<{len(samples)}h', *samples))
-    
-    return buffer.getvalue()
+    first_len = int(sample_rate * 0.1)    # 880 Hz for 100ms
+    pause_len = int(sample_rate * 0.05)   # silence for 50ms
+    second_len = int(sample_rate * 0.15)  # 1046 Hz (C6) for 150ms
+    
+    # Preallocate the whole (zeroed) buffer, then fill each tone in place
+    samples = array.array('h', bytes(2 * (first_len + pause_len + second_len)))
+    samples[:first_len] = _tone(
+        880, first_len, int(sample_rate * 0.01), sample_rate, max_amplitude
+    )
+    samples[first_len + pause_len:] = _tone(
+        1046, second_len, int(sample_rate * 0.015), sample_rate, max_amplitude
+    )
+    
+    return _pcm_to_wav(samples, sample_rate)
+
+
+# Prebuilt notification sound shipped with the package. Regenerate with:
+#   NOTIFICATION_WAV.write_bytes(generate_notification_sound())
+NOTIFICATION_WAV = Path(__file__).parent / 'resources' / 'notification.wav'
 
 
 class SoundPlayer:
     """
     Cross-platform sound player.
-    Uses Qt multimedia for playback with fallbacks.
+    Uses Qt multimedia (QSoundEffect) so playback needs no subprocess.
     """
     
+    __slots__ = ('_enabled', '_sound_file', '_effect')
+    
     def __init__(self):
         self._enabled = True
-        self._sound_data: Optional[bytes] = None
-        self._temp_file: Optional[str] = None
-        
-        # Generate and cache the notification sound
-        self._sound_data = generate_notification_sound()
-        self._setup_temp_file()
-    
-    def _setup_temp_file(self):
-        """Create a temporary file for the sound (needed for some playback methods)."""
-        if self._sound_data is None:
-            return
+        self._sound_file: Optional[str] = (
+            str(NOTIFICATION_WAV) if NOTIFICATION_WAV.is_file() else None
+        )
         
-        import tempfile
-        fd, self._temp_file = tempfile.mkstemp(suffix='.wav')
-        with os.fdopen(fd, 'wb') as f:
-            f.write(self._sound_data)
+        # QSoundEffect keeps the decoded PCM in memory for instant replays
+        self._effect = QSoundEffect()
+        if self._sound_file:
+            self._effect.setSource(QUrl.fromLocalFile(self._sound_file))
+        self._effect.setVolume(1.0)
+        self._effect.setLoopCount(1)
     
     @property
     def enabled(self) -> bool:
@@ -148,7 +160,7 @@ class SoundPlayer:
     
     def play(self):
         """Play the notification sound."""
-        if not self._enabled or not self._temp_file:
+        if not self._enabled or not self._sound_file:
             return
         
         try:
@@ -157,42 +169,12 @@ class SoundPlayer:
             print(f"Warning: Could not play sound: {e}")
     
     def _play_sound(self):
-        """Platform-specific sound playback."""
-        system = sys.platform.lower()
-        
-        if system == 'darwin':
-            # macOS: use afplay
-            subprocess.Popen(
-                ['afplay', self._temp_file],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-        elif system.startswith('linux'):
-            # Linux: try paplay (PulseAudio), then aplay (ALSA)
-            for cmd in ['paplay', 'aplay']:
-                try:
-                    subprocess.Popen(
-                        [cmd, self._temp_file],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                    return
-                except FileNotFoundError:
-                    continue
-            # Fallback: try using pygame or other methods
-            print("Warning: No audio player found (tried paplay, aplay)")
-        elif system == 'win32':
-            # Windows: use winsound
-            import winsound
-            winsound.PlaySound(self._temp_file, winsound.SND_FILENAME | winsound.SND_ASYNC)
+        """Replay the preloaded sound effect."""
+        self._effect.play()
     
     def cleanup(self):
-        """Clean up temporary files."""
-        if self._temp_file and os.path.exists(self._temp_file):
-            try:
-                os.remove(self._temp_file)
-            except Exception:
-                pass
+        """Stop any sound that is still playing."""
+        self._effect.stop()
 
 
 class NotificationManager(QObject):
@@ -208,6 +190,8 @@ class NotificationManager(QObject):
         self._tray_icon: Optional[QSystemTrayIcon] = None
         self._notification_enabled = True
         self._sound_enabled = True
+        # Session-bus connection reused for native notifications on Linux
+        self._dbus_connection = None
     
     def set_tray_icon(self, tray_icon: QSystemTrayIcon):
         """Set the system tray icon for showing notifications."""
@@ -287,42 +271,90 @@ class NotificationManager(QObject):
             # Fallback: try native notification command
             self._show_native_notification(title, message)
     
+    # AppleScript reads title/message from argv, so no quoting is needed
+    OSASCRIPT_NOTIFY = (
+        'on run argv',
+        'display notification (item 2 of argv) with title (item 1 of argv)',
+        'end run',
+    )
+    
     def _show_native_notification(self, title: str, message: str):
-        """Show notification using native OS commands."""
+        """Show notification using native OS facilities without blocking."""
         system = sys.platform.lower()
         
         try:
             if system == 'darwin':
                 # macOS: use osascript
-                script = f'display notification "{message}" with title "{title}"'
-                subprocess.run(
-                    ['osascript', '-e', script],
-                    capture_output=True,
-                    timeout=5
-                )
+                script_args = []
+                for line in self.OSASCRIPT_NOTIFY:
+                    script_args += ['-e', line]
+                self._spawn_detached(['osascript', *script_args, title, message])
             elif system.startswith('linux'):
-                # Linux: use notify-send
-                subprocess.run(
-                    ['notify-send', title, message],
-                    capture_output=True,
-                    timeout=5
-                )
+                # Linux: D-Bus Notify, falling back to notify-send
+                if not self._notify_dbus(title, message):
+                    self._spawn_detached(['notify-send', title, message])
             # Windows notifications handled by tray icon
         except Exception as e:
             print(f"Warning: Could not show notification: {e}")
     
+    def _spawn_detached(self, cmd: list):
+        """Start a notification command without waiting for it."""
+        subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    
+    def _notify_dbus(self, title: str, message: str) -> bool:
+        """
+        Send org.freedesktop.Notifications.Notify over a persistent
+        session-bus connection (requires jeepney).
+        
+        Returns:
+            True if the message was sent.
+        """
+        try:
+            from jeepney import DBusAddress, new_method_call
+            from jeepney.io.blocking import open_dbus_connection
+        except ImportError:
+            return False
+        
+        try:
+            if self._dbus_connection is None:
+                self._dbus_connection = open_dbus_connection(bus='SESSION')
+            
+            address = DBusAddress(
+                '/org/freedesktop/Notifications',
+                bus_name='org.freedesktop.Notifications',
+                interface='org.freedesktop.Notifications'
+            )
+            # app_name, replaces_id, app_icon, summary, body, actions, hints, timeout
+            self._dbus_connection.send(new_method_call(
+                address, 'Notify', 'susssasa{sv}i',
+                ('Focus Timer', 0, '', title, message, [], {}, 3000)
+            ))
+            return True
+        except Exception:
+            self._close_dbus()
+            return False
+    
+    def _close_dbus(self):
+        """Close the notification D-Bus connection, if open."""
+        if self._dbus_connection is not None:
+            try:
+                self._dbus_connection.close()
+            except Exception:
+                pass
+            self._dbus_connection = None
+    
     def cleanup(self):
         """Clean up resources."""
         self._sound_player.cleanup()
+        self._close_dbus()
 
 
-# Global instance
-_notification_manager: Optional[NotificationManager] = None
-
-
+@cache
 def get_notification_manager() -> NotificationManager:
     """Get or create the global NotificationManager instance."""
-    global _notification_manager
-    if _notification_manager is None:
-        _notification_manager = NotificationManager()
-    return _notification_manager
+    return NotificationManager()
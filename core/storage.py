@@ -5,26 +5,35 @@ Handles database initialization, CRUD operations, and queries.
 
 import sqlite3
 import os
+import sys
 import time
 import csv
+import itertools
+from functools import cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from .models import Group, Session, SessionStatus, AppSettings
 
 
+# Platform checks resolved once at import (sys.platform needs no syscall)
+_IS_WIN = os.name == 'nt'
+_IS_MAC = sys.platform == 'darwin'
+
+
+@cache
 def get_app_data_dir() -> Path:
     """
     Get the appropriate application data directory based on OS.
     Creates the directory if it doesn't exist.
     """
-    if os.name == 'nt':  # Windows
+    if _IS_WIN:  # Windows
         base = Path(os.environ.get('APPDATA', Path.home()))
     elif os.name == 'posix':
         # macOS uses ~/Library/Application Support, Linux uses ~/.local/share
-        if os.uname().sysname == 'Darwin':
+        if _IS_MAC:
             base = Path.home() / 'Library' / 'Application Support'
         else:
             base = Path(os.environ.get('XDG_DATA_HOME', Path.home() / '.local' / 'share'))
@@ -36,12 +45,61 @@ def get_app_data_dir() -> Path:
     return app_dir
 
 
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean stored as 'True'/'False' text."""
+    return value.lower() == 'true'
+
+
+# Persisted AppSettings fields and how to parse each stored text value
+_SETTINGS_CONVERTERS = {
+    'auto_start_break': _parse_bool,
+    'auto_start_focus': _parse_bool,
+    'keep_screen_awake': _parse_bool,
+    'sound_enabled': _parse_bool,
+    'notification_enabled': _parse_bool,
+    'log_breaks': _parse_bool,
+}
+
+
+# Session filter shape: (include_breaks, by_group, by_start, by_end)
+FilterShape = Tuple[bool, bool, bool, bool]
+
+
+def _session_where(shape: FilterShape) -> str:
+    """Build the WHERE clause for one combination of session filters."""
+    include_breaks, by_group, by_start, by_end = shape
+    clauses = [] if include_breaks else ['s.is_break = 0']
+    if by_group:
+        clauses.append('s.group_id = ?')
+    if by_start:
+        clauses.append('s.start_ts >= ?')
+    if by_end:
+        clauses.append('s.start_ts <= ?')
+    return ' AND '.join(clauses) or '1=1'
+
+
+def _sql_variants(template: str) -> Dict[FilterShape, str]:
+    """
+    Expand a query template's {where} placeholder for every filter shape.
+    
+    Callers look the SQL up by shape, so each variant is one fixed string
+    that stays in the connection's statement cache.
+    """
+    return {
+        shape: template.format(where=_session_where(shape))
+        for shape in itertools.product((False, True), repeat=4)
+    }
+
+
 class Storage:
     """
     Database storage manager.
     Handles all SQLite operations for groups and sessions.
     """
 
+    # Number of prepared statements kept by the connection, keyed by SQL text
+    STATEMENT_CACHE_SIZE = 256
+
     def __init__(self, db_path: Optional[str] = None):
         """
         Initialize storage with database path.
@@ -54,21 +112,95 @@ class Storage:
             db_path = str(get_app_data_dir() / 'focus_timer.db')
         
         self.db_path = db_path
+        
+        # One long-lived connection so prepared statements are reused
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._transaction_depth = 0
+        # Bumped on every group / session / settings write so callers
+        # can skip reloading data that has not changed
+        self._groups_version = 0
+        self._sessions_version = 0
+        self._settings_version = 0
+        
+        # Cached local-midnight epochs for statistics queries
+        self._day_key: Optional[Tuple[int, int]] = None
+        self._day_start = 0
+        self._week_start = 0
+        self._configure_connection()
         self._init_database()
 
+    def _configure_connection(self):
+        """
+        Apply performance PRAGMAs to the connection.
+        
+        WAL with synchronous=NORMAL avoids an fsync per commit and keeps
+        reads from blocking on writes. journal_mode persists in the database
+        file; the other settings are per-connection. auto_vacuum only takes
+        effect on a brand-new file, so it has to come before journal_mode.
+        """
+        self._conn.executescript('''
+            PRAGMA auto_vacuum = INCREMENTAL;
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -65536;
+            PRAGMA mmap_size = 268435456;
+        ''')
+
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Context manager running a transaction on the shared connection."""
+        conn = self._conn
+        if self._transaction_depth:
+            # Inside transaction(): the outermost block commits
+            yield conn
+            return
         try:
             yield conn
             conn.commit()
         except Exception as e:
             conn.rollback()
             raise e
-        finally:
-            conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several storage calls into a single transaction.
+        
+        Writes made inside the block are committed once when it exits,
+        or rolled back together if it raises.
+        """
+        with self._get_connection():
+            self._transaction_depth += 1
+            try:
+                yield
+            finally:
+                self._transaction_depth -= 1
+
+    def maintenance(self):
+        """
+        Reclaim free pages and refresh planner statistics.
+        Cheap enough to run once at application exit.
+        
+        incremental_vacuum only frees pages on databases created with
+        auto_vacuum; optimize runs ANALYZE only on tables that need it.
+        """
+        try:
+            self._conn.executescript('''
+                PRAGMA incremental_vacuum(1000);
+                PRAGMA optimize;
+            ''')
+        except sqlite3.Error as e:
+            print(f"Warning: Database maintenance failed: {e}")
+
+    def close(self):
+        """Close the database connection. Call before application exit."""
+        self._conn.close()
 
     def _init_database(self):
         """Initialize database schema if tables don't exist."""
@@ -112,14 +244,30 @@ class Storage:
                 )
             ''')
 
-            # Create indexes for common queries
+            # Create indexes for common queries. Both cover the columns the
+            # statistics queries read, so they are answered from the index
+            # alone. They supersede the older single-column indexes.
+            cursor.execute('DROP INDEX IF EXISTS idx_sessions_group')
+            cursor.execute('DROP INDEX IF EXISTS idx_sessions_start')
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_sessions_group 
-                ON sessions(group_id)
+                CREATE INDEX IF NOT EXISTS idx_sessions_grp_break_ts 
+                ON sessions(group_id, is_break, start_ts, actual_sec)
             ''')
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_sessions_start 
-                ON sessions(start_ts)
+                CREATE INDEX IF NOT EXISTS idx_sessions_start_desc 
+                ON sessions(start_ts DESC, is_break, actual_sec)
+            ''')
+
+            # Deleting a group removes its sessions in the same statement.
+            # A trigger rather than ON DELETE CASCADE: cascades need
+            # foreign_keys=ON, which would also reject sessions saved with
+            # no category (group_id 0) or for a just-deleted one.
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_groups_delete_sessions
+                AFTER DELETE ON groups
+                BEGIN
+                    DELETE FROM sessions WHERE group_id = OLD.id;
+                END
             ''')
 
             # Insert default groups if none exist
@@ -140,6 +288,11 @@ class Storage:
 
     # ==================== Group CRUD ====================
 
+    @property
+    def groups_version(self) -> int:
+        """Counter that changes whenever a group is created, updated or deleted."""
+        return self._groups_version
+
     def create_group(self, group: Group) -> int:
         """
         Create a new group.
@@ -162,6 +315,7 @@ class Storage:
                 group.color,
                 group.created_at
             ))
+            self._groups_version += 1
             return cursor.lastrowid
 
     def get_group(self, group_id: int) -> Optional[Group]:
@@ -204,6 +358,7 @@ class Storage:
                 group.color,
                 group.id
             ))
+            self._groups_version += 1
             return cursor.rowcount > 0
 
     def delete_group(self, group_id: int) -> bool:
@@ -216,10 +371,10 @@ class Storage:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            # First delete associated sessions
-            cursor.execute('DELETE FROM sessions WHERE group_id = ?', (group_id,))
-            # Then delete the group
+            # Sessions are removed by trg_groups_delete_sessions
             cursor.execute('DELETE FROM groups WHERE id = ?', (group_id,))
+            self._groups_version += 1
+            self._sessions_version += 1
             return cursor.rowcount > 0
 
     def _row_to_group(self, row: sqlite3.Row) -> Group:
@@ -235,6 +390,38 @@ class Storage:
 
     # ==================== Session CRUD ====================
 
+    @property
+    def sessions_version(self) -> int:
+        """Counter that changes whenever sessions are added or deleted."""
+        return self._sessions_version
+
+    # Column order _row_to_session unpacks by index
+    _SESSION_COLUMNS = (
+        'id, group_id, start_ts, end_ts, planned_sec, actual_sec, '
+        'status, note, is_break, created_at'
+    )
+
+    _SESSION_COLUMNS_S = ', '.join('s.' + c for c in _SESSION_COLUMNS.split(', '))
+
+    _SELECT_SESSION_SQL = f'SELECT {_SESSION_COLUMNS} FROM sessions WHERE id = ?'
+
+    # Session queries, one precompiled string per filter shape
+    _SESSIONS_SQL = _sql_variants(
+        f'SELECT {_SESSION_COLUMNS} FROM sessions s WHERE {{where}} '
+        'ORDER BY s.start_ts DESC LIMIT ?'
+    )
+    _SESSIONS_WITH_GROUP_SQL = _sql_variants(
+        f'SELECT {_SESSION_COLUMNS_S}, g.name, g.color '
+        'FROM sessions s LEFT JOIN groups g ON g.id = s.group_id '
+        'WHERE {where} ORDER BY s.start_ts DESC LIMIT ? OFFSET ?'
+    )
+
+    _INSERT_SESSION_SQL = '''
+        INSERT INTO sessions 
+        (group_id, start_ts, end_ts, planned_sec, actual_sec, status, note, is_break, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
     def create_session(self, session: Session) -> int:
         """
         Create a new session record.
@@ -247,28 +434,50 @@ class Storage:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO sessions 
-                (group_id, start_ts, end_ts, planned_sec, actual_sec, status, note, is_break, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                session.group_id,
-                session.start_ts,
-                session.end_ts,
-                session.planned_seconds,
-                session.actual_seconds,
-                session.status,
-                session.note,
-                1 if session.is_break else 0,
-                session.created_at
-            ))
+            cursor.execute(self._INSERT_SESSION_SQL, self._session_params(session))
+            self._sessions_version += 1
             return cursor.lastrowid
 
+    def create_sessions(self, sessions: Iterable[Session]) -> int:
+        """
+        Create many session records in one transaction.
+        
+        Args:
+            sessions: Session objects to create.
+            
+        Returns:
+            Number of sessions created.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                self._INSERT_SESSION_SQL,
+                (self._session_params(session) for session in sessions)
+            )
+            self._sessions_version += 1
+            return cursor.rowcount
+
+    @staticmethod
+    def _session_params(session: Session) -> tuple:
+        """Convert a Session to INSERT parameters."""
+        return (
+            session.group_id,
+            session.start_ts,
+            session.end_ts,
+            session.planned_seconds,
+            session.actual_seconds,
+            session.status,
+            session.note,
+            1 if session.is_break else 0,
+            session.created_at
+        )
+
     def get_session(self, session_id: int) -> Optional[Session]:
         """Get a session by ID."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM sessions WHERE id = ?', (session_id,))
+            cursor.row_factory = None
+            cursor.execute(self._SELECT_SESSION_SQL, (session_id,))
             row = cursor.fetchone()
             if row:
                 return self._row_to_session(row)
@@ -295,33 +504,73 @@ class Storage:
         Returns:
             List of matching sessions.
         """
-        query = 'SELECT * FROM sessions WHERE 1=1'
-        params = []
+        shape, params = self._session_filter(group_id, start_date, end_date, include_breaks)
+        query = self._SESSIONS_SQL[shape]
+        params.append(limit)
 
-        if not include_breaks:
-            query += ' AND is_break = 0'
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # tuples: much cheaper than Row per column
+            cursor.execute(query, params)
+            return [self._row_to_session(row) for row in cursor.fetchall()]
 
+    def get_sessions_with_group(
+        self,
+        group_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        include_breaks: bool = False,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[Tuple[Session, Optional[str], Optional[str]]]:
+        """
+        Get sessions together with their group's name and color.
+        Takes the same filters as get_sessions, in a single joined query.
+        Pass offset to fetch the following page of the same filter.
+        
+        Returns:
+            List of tuples: (Session, group_name, group_color). Name and
+            color are None for sessions whose group no longer exists.
+        """
+        shape, params = self._session_filter(group_id, start_date, end_date, include_breaks)
+        query = self._SESSIONS_WITH_GROUP_SQL[shape]
+        params += (limit, offset)
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            return [
+                (self._row_to_session(row), row[10], row[11])
+                for row in cursor.fetchall()
+            ]
+
+    @staticmethod
+    def _session_filter(
+        group_id: Optional[int],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        include_breaks: bool
+    ) -> Tuple[FilterShape, list]:
+        """
+        Get the filter shape and matching parameters for the session filters.
+        Parameters are in the order _session_where emits the placeholders.
+        """
+        params = []
         if group_id is not None:
-            query += ' AND group_id = ?'
             params.append(group_id)
-
         if start_date is not None:
-            start_ts = int(start_date.timestamp())
-            query += ' AND start_ts >= ?'
-            params.append(start_ts)
-
+            params.append(int(start_date.timestamp()))
         if end_date is not None:
-            end_ts = int(end_date.timestamp())
-            query += ' AND start_ts <= ?'
-            params.append(end_ts)
-
-        query += ' ORDER BY start_ts DESC LIMIT ?'
-        params.append(limit)
+            params.append(int(end_date.timestamp()))
 
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            return [self._row_to_session(row) for row in cursor.fetchall()]
+        shape = (
+            include_breaks,
+            group_id is not None,
+            start_date is not None,
+            end_date is not None
+        )
+        return shape, params
 
     def update_session_note(self, session_id: int, note: str) -> bool:
         """Update the note for a session."""
@@ -333,57 +582,114 @@ class Storage:
             )
             return cursor.rowcount > 0
 
-    def _row_to_session(self, row: sqlite3.Row) -> Session:
-        """Convert a database row to a Session object."""
+    def _row_to_session(self, row: tuple) -> Session:
+        """Convert a plain row selected with _SESSION_COLUMNS to a Session."""
         return Session(
-            id=row['id'],
-            group_id=row['group_id'],
-            start_ts=row['start_ts'],
-            end_ts=row['end_ts'],
-            planned_seconds=row['planned_sec'],
-            actual_seconds=row['actual_sec'],
-            status=row['status'],
-            note=row['note'],
-            is_break=bool(row['is_break']),
-            created_at=row['created_at']
+            id=row[0],
+            group_id=row[1],
+            start_ts=row[2],
+            end_ts=row[3],
+            planned_seconds=row[4],
+            actual_seconds=row[5],
+            status=row[6],
+            note=row[7],
+            is_break=bool(row[8]),
+            created_at=row[9]
         )
 
     # ==================== Statistics Queries ====================
 
     def get_today_total_seconds(self, group_id: Optional[int] = None) -> int:
         """Get total focused seconds for today."""
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        return self._get_total_seconds_since(today, group_id)
+        today_start, _ = self._day_and_week_start()
+        return self._get_total_seconds_since(today_start, group_id)
 
     def get_week_total_seconds(self, group_id: Optional[int] = None) -> int:
         """Get total focused seconds for this week (Monday start)."""
-        today = datetime.now()
-        start_of_week = today - timedelta(days=today.weekday())
-        start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
-        return self._get_total_seconds_since(start_of_week, group_id)
+        _, week_start = self._day_and_week_start()
+        return self._get_total_seconds_since(week_start, group_id)
+
+    # Week start is never after today's start, so one range scan over the
+    # week covers all three figures
+    _PERIOD_STATS_SQL = '''
+        SELECT
+            COALESCE(SUM(CASE WHEN start_ts >= ? THEN actual_sec END), 0),
+            COALESCE(SUM(actual_sec), 0),
+            COUNT(CASE WHEN start_ts >= ? THEN 1 END)
+        FROM sessions
+        WHERE start_ts >= ? AND is_break = 0
+    '''
+
+    def get_period_stats(self) -> Tuple[int, int, int]:
+        """
+        Get today's and this week's statistics in a single query.
+        
+        Returns:
+            Tuple of (today focused seconds, week focused seconds,
+            today focus session count).
+        """
+        today_start, week_start = self._day_and_week_start()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                self._PERIOD_STATS_SQL, (today_start, today_start, week_start)
+            )
+            return cursor.fetchone()
+
+    def _day_and_week_start(self) -> Tuple[int, int]:
+        """
+        Get the epoch timestamps of local midnight today and on this
+        week's Monday. Recomputed only when the local date changes.
+        """
+        now = time.localtime()
+        day_key = (now.tm_year, now.tm_yday)
+        if day_key != self._day_key:
+            # mktime normalizes an out-of-range day, e.g. Monday of a week
+            # that started in the previous month
+            year, month, day = now.tm_year, now.tm_mon, now.tm_mday
+            self._day_start = int(time.mktime((year, month, day, 0, 0, 0, 0, 0, -1)))
+            self._week_start = int(time.mktime(
+                (year, month, day - now.tm_wday, 0, 0, 0, 0, 0, -1)
+            ))
+            self._day_key = day_key
+        return self._day_start, self._week_start
+
+    # One static statement per filter shape so both stay in the
+    # statement cache instead of being rebuilt per call
+    _TOTAL_ALL_SQL = (
+        'SELECT COALESCE(SUM(actual_sec), 0) FROM sessions '
+        'WHERE start_ts >= ? AND is_break = 0'
+    )
+    _TOTAL_GROUP_SQL = _TOTAL_ALL_SQL + ' AND group_id = ?'
 
     def _get_total_seconds_since(
         self, 
-        since: datetime, 
+        since_ts: int, 
         group_id: Optional[int] = None
     ) -> int:
-        """Helper to get total seconds since a given datetime."""
-        query = '''
-            SELECT COALESCE(SUM(actual_sec), 0) as total
-            FROM sessions
-            WHERE start_ts >= ? AND is_break = 0
-        '''
-        params = [int(since.timestamp())]
-
-        if group_id is not None:
-            query += ' AND group_id = ?'
-            params.append(group_id)
+        """Helper to get total seconds since a given Unix timestamp."""
+        if group_id is None:
+            query, params = self._TOTAL_ALL_SQL, (since_ts,)
+        else:
+            query, params = self._TOTAL_GROUP_SQL, (since_ts, group_id)
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
             cursor.execute(query, params)
-            result = cursor.fetchone()
-            return result['total'] if result else 0
+            return cursor.fetchone()[0]
+
+    _GROUP_TOTALS_SQL = _sql_variants('''
+        SELECT 
+            g.id, g.name, g.default_focus, g.default_break, g.color, g.created_at,
+            COALESCE(SUM(s.actual_sec), 0) as total_seconds,
+            COUNT(s.id) as session_count
+        FROM groups g
+        LEFT JOIN sessions s ON g.id = s.group_id AND s.is_break = 0
+        WHERE {where}
+        GROUP BY g.id ORDER BY total_seconds DESC
+    ''')
 
     def get_group_totals(
         self,
@@ -396,28 +702,9 @@ class Storage:
         Returns:
             List of tuples: (Group, total_seconds, session_count)
         """
-        query = '''
-            SELECT 
-                g.id, g.name, g.default_focus, g.default_break, g.color, g.created_at,
-                COALESCE(SUM(s.actual_sec), 0) as total_seconds,
-                COUNT(s.id) as session_count
-            FROM groups g
-            LEFT JOIN sessions s ON g.id = s.group_id AND s.is_break = 0
-        '''
-        params = []
-
-        where_clauses = []
-        if start_date is not None:
-            where_clauses.append('s.start_ts >= ?')
-            params.append(int(start_date.timestamp()))
-        if end_date is not None:
-            where_clauses.append('s.start_ts <= ?')
-            params.append(int(end_date.timestamp()))
-
-        if where_clauses:
-            query += ' WHERE ' + ' AND '.join(where_clauses)
-
-        query += ' GROUP BY g.id ORDER BY total_seconds DESC'
+        # Breaks are excluded in the join, so the WHERE only filters dates
+        shape, params = self._session_filter(None, start_date, end_date, True)
+        query = self._GROUP_TOTALS_SQL[shape]
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -437,36 +724,69 @@ class Storage:
 
     # ==================== Settings ====================
 
+    @property
+    def settings_version(self) -> int:
+        """Counter that changes whenever settings are saved."""
+        return self._settings_version
+
     def get_settings(self) -> AppSettings:
         """Get application settings."""
         settings = AppSettings()
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
             cursor.execute('SELECT key, value FROM settings')
-            for row in cursor.fetchall():
-                key, value = row['key'], row['value']
-                if hasattr(settings, key):
-                    # Convert string to appropriate type
-                    if value.lower() in ('true', 'false'):
-                        setattr(settings, key, value.lower() == 'true')
-                    else:
-                        setattr(settings, key, value)
+            for key, value in cursor.fetchall():
+                convert = _SETTINGS_CONVERTERS.get(key)
+                if convert is not None:
+                    setattr(settings, key, convert(value))
         return settings
 
     def save_settings(self, settings: AppSettings):
         """Save application settings."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            for key in ['auto_start_break', 'auto_start_focus', 'keep_screen_awake',
-                       'sound_enabled', 'notification_enabled', 'log_breaks']:
-                value = str(getattr(settings, key))
-                cursor.execute('''
-                    INSERT OR REPLACE INTO settings (key, value)
-                    VALUES (?, ?)
-                ''', (key, value))
+            cursor.executemany(
+                'INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)',
+                [(key, str(getattr(settings, key))) for key in _SETTINGS_CONVERTERS]
+            )
+            self._settings_version += 1
+
+    def update_settings(self, **values: bool):
+        """
+        Save only the given settings, leaving the others as stored.
+        
+        Args:
+            **values: AppSettings field names mapped to their new values.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                'INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)',
+                [(key, str(value)) for key, value in values.items()
+                 if key in _SETTINGS_CONVERTERS]
+            )
+            self._settings_version += 1
 
     # ==================== Export ====================
 
+    # SQLite formats the timestamps, note and flag; minutes are rounded in Python
+    _EXPORT_SQL = _sql_variants('''
+        SELECT 
+            s.id, g.name as group_name,
+            strftime('%Y-%m-%d %H:%M:%S', s.start_ts, 'unixepoch', 'localtime'),
+            strftime('%Y-%m-%d %H:%M:%S', s.end_ts, 'unixepoch', 'localtime'),
+            s.planned_sec,
+            s.actual_sec,
+            s.status,
+            IFNULL(s.note, ''),
+            CASE WHEN s.is_break THEN 'Yes' ELSE 'No' END
+        FROM sessions s
+        JOIN groups g ON s.group_id = g.id
+        WHERE {where}
+        ORDER BY s.start_ts
+    ''')
+
     def export_to_csv(
         self,
         filepath: str,
@@ -486,52 +806,33 @@ class Storage:
         Returns:
             Number of sessions exported.
         """
-        # Build query
-        query = '''
-            SELECT 
-                s.id, g.name as group_name, s.start_ts, s.end_ts,
-                s.planned_sec, s.actual_sec, s.status, s.note, s.is_break
-            FROM sessions s
-            JOIN groups g ON s.group_id = g.id
-            WHERE 1=1
-        '''
-        params = []
+        shape, params = self._session_filter(group_id, start_date, end_date, True)
+        query = self._EXPORT_SQL[shape]
 
-        if group_id is not None:
-            query += ' AND s.group_id = ?'
-            params.append(group_id)
-        if start_date is not None:
-            query += ' AND s.start_ts >= ?'
-            params.append(int(start_date.timestamp()))
-        if end_date is not None:
-            query += ' AND s.start_ts <= ?'
-            params.append(int(end_date.timestamp()))
+        exported = 0
 
-        query += ' ORDER BY s.start_ts'
+        def format_rows(cursor):
+            """Yield CSV rows straight from the cursor, counting them."""
+            nonlocal exported
+            for row in cursor:
+                exported += 1
+                # Minutes are rounded by Python, not SQLite: round() works on
+                # the binary value, and SQLite's round() differs for about
+                # one duration in six
+                yield row[:4] + (round(row[4] / 60, 1), round(row[5] / 60, 1)) + row[6:]
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None  # plain tuples go straight to csv
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-
-        # Write to CSV
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'ID', 'Group', 'Start Time', 'End Time',
-                'Planned (min)', 'Actual (min)', 'Status', 'Note', 'Is Break'
-            ])
-            for row in rows:
+
+            # Stream to CSV without materializing the result set
+            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
                 writer.writerow([
-                    row['id'],
-                    row['group_name'],
-                    datetime.fromtimestamp(row['start_ts']).strftime('%Y-%m-%d %H:%M:%S'),
-                    datetime.fromtimestamp(row['end_ts']).strftime('%Y-%m-%d %H:%M:%S'),
-                    round(row['planned_sec'] / 60, 1),
-                    round(row['actual_sec'] / 60, 1),
-                    row['status'],
-                    row['note'] or '',
-                    'Yes' if row['is_break'] else 'No'
+                    'ID', 'Group', 'Start Time', 'End Time',
+                    'Planned (min)', 'Actual (min)', 'Status', 'Note', 'Is Break'
                 ])
+                writer.writerows(format_rows(cursor))
 
-        return len(rows)
+        return exported
@@ -1,17 +1,24 @@
 """
 Timer engine for the Focus Timer application.
 Implements a robust state machine for managing timer states.
-Uses timestamp-based calculations to prevent drift.
+Uses monotonic-clock calculations to prevent drift; wall-clock time
+is only recorded for the saved session history.
 """
 
 import time
-from typing import Optional, Callable
-from PySide6.QtCore import QObject, QTimer, Signal
+from typing import Optional, Callable, Tuple
+from PySide6.QtCore import QObject, QTimer, Qt, Signal, Slot
 
-from .models import TimerState, TimerContext, Session, SessionStatus
+from .models import TimerState, TimerContext, Session, SessionStatus, AppSettings
 from .storage import Storage
 
 
+NS_PER_SECOND = 1_000_000_000
+
+# States in which the countdown is ticking
+_RUNNING_STATES = frozenset((TimerState.FOCUS, TimerState.BREAK))
+
+
 class TimerEngine(QObject):
     """
     Core timer engine implementing a state machine.
@@ -33,8 +40,10 @@ class TimerEngine(QObject):
     phase_changed = Signal(TimerState, TimerState)  # old_state, new_state
     session_completed = Signal(Session)
 
-    # Tick interval in milliseconds (200-500ms as specified)
-    TICK_INTERVAL_MS = 300
+    # Tick interval in milliseconds. The countdown only changes once per
+    # second, so each tick is scheduled just past the next whole-second
+    # boundary of the session rather than polling faster.
+    TICK_INTERVAL_MS = 1000
 
     def __init__(self, storage: Storage, parent: Optional[QObject] = None):
         """
@@ -54,14 +63,25 @@ class TimerEngine(QObject):
         # State before pause (to restore after resume)
         self._state_before_pause: Optional[TimerState] = None
         
-        # Qt timer for UI updates
+        # Qt timer for UI updates, re-armed by _schedule_tick() each second
         self._qt_timer = QTimer(self)
+        self._qt_timer.setSingleShot(True)
+        self._qt_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._qt_timer.setInterval(self.TICK_INTERVAL_MS)
         self._qt_timer.timeout.connect(self._on_tick)
         
         # Session tracking
         self._current_session_start: int = 0
         self._current_planned_seconds: int = 0
+        # Monotonic reading at which the running phase ends
+        self._deadline_ns: int = 0
+        
+        # (state, remaining_seconds) of the last tick, to skip repeats
+        self._last_emit: Optional[Tuple[TimerState, int]] = None
+        
+        # Settings read lazily and kept until they are saved again
+        self._settings: Optional[AppSettings] = None
+        self._settings_version = -1
 
     @property
     def context(self) -> TimerContext:
@@ -76,7 +96,7 @@ class TimerEngine(QObject):
     @property
     def is_running(self) -> bool:
         """Check if timer is actively running (not paused or idle)."""
-        return self._context.state in (TimerState.FOCUS, TimerState.BREAK)
+        return self._context.state in _RUNNING_STATES
 
     @property
     def is_focus(self) -> bool:
@@ -125,18 +145,23 @@ class TimerEngine(QObject):
         self._context.total_seconds = focus_minutes * 60
         self._context.remaining_seconds = self._context.total_seconds
         self._context.session_start_ts = int(time.time())
+        self._context.session_start_ns = time.monotonic_ns()
         self._context.total_paused_seconds = 0
+        self._context.total_paused_ns = 0
+        self._deadline_ns = (
+            self._context.session_start_ns + self._context.total_seconds * NS_PER_SECOND
+        )
         
         # Track session for saving
         self._current_session_start = self._context.session_start_ts
         self._current_planned_seconds = self._context.total_seconds
         
         # Start the timer
-        self._qt_timer.start()
+        self._schedule_tick()
         
         # Emit state change
         self.phase_changed.emit(old_state, TimerState.FOCUS)
-        self.tick.emit(self._context)
+        self._emit_tick()
 
     def start_break(self):
         """Start the break period after focus."""
@@ -151,19 +176,23 @@ class TimerEngine(QObject):
         self._context.total_seconds = self._context.break_minutes * 60
         self._context.remaining_seconds = self._context.total_seconds
         self._context.session_start_ts = int(time.time())
+        self._context.session_start_ns = time.monotonic_ns()
         self._context.total_paused_seconds = 0
+        self._context.total_paused_ns = 0
+        self._deadline_ns = (
+            self._context.session_start_ns + self._context.total_seconds * NS_PER_SECOND
+        )
         
         # Track break session
         self._current_session_start = self._context.session_start_ts
         self._current_planned_seconds = self._context.total_seconds
         
-        # Start/continue the timer
-        if not self._qt_timer.isActive():
-            self._qt_timer.start()
+        # Start the timer, aligned to the new session
+        self._schedule_tick()
         
         # Emit state change
         self.phase_changed.emit(old_state, TimerState.BREAK)
-        self.tick.emit(self._context)
+        self._emit_tick()
 
     def pause(self):
         """Pause the current timer."""
@@ -174,13 +203,14 @@ class TimerEngine(QObject):
         self._state_before_pause = old_state
         self._context.state = TimerState.PAUSED
         self._context.pause_start_ts = int(time.time())
+        self._context.pause_start_ns = time.monotonic_ns()
         
         # Stop the ticker (but don't save session yet)
         self._qt_timer.stop()
         
         # Emit state change
         self.phase_changed.emit(old_state, TimerState.PAUSED)
-        self.tick.emit(self._context)
+        self._emit_tick()
 
     def resume(self):
         """Resume from paused state."""
@@ -188,21 +218,24 @@ class TimerEngine(QObject):
             return
         
         # Calculate how long we were paused
-        pause_duration = int(time.time()) - self._context.pause_start_ts
-        self._context.total_paused_seconds += pause_duration
+        pause_duration_ns = time.monotonic_ns() - self._context.pause_start_ns
+        self._context.total_paused_ns += pause_duration_ns
+        self._deadline_ns += pause_duration_ns
+        self._context.total_paused_seconds = self._context.total_paused_ns // NS_PER_SECOND
         
         # Restore previous state
         old_state = TimerState.PAUSED
         self._context.state = self._state_before_pause
         self._state_before_pause = None
         self._context.pause_start_ts = 0
+        self._context.pause_start_ns = 0
         
         # Restart the ticker
-        self._qt_timer.start()
+        self._schedule_tick()
         
         # Emit state change
         self.phase_changed.emit(old_state, self._context.state)
-        self.tick.emit(self._context)
+        self._emit_tick()
 
     def stop(self):
         """Stop the timer and save session as interrupted."""
@@ -220,7 +253,7 @@ class TimerEngine(QObject):
         self._qt_timer.stop()
         
         # Save break session if logging breaks is enabled
-        settings = self.storage.get_settings()
+        settings = self._get_settings()
         if settings.log_breaks:
             self._save_session(completed=False, is_break=True)
         
@@ -229,51 +262,76 @@ class TimerEngine(QObject):
         
         # Emit state change
         self.phase_changed.emit(old_state, TimerState.IDLE)
-        self.tick.emit(self._context)
+        self._emit_tick()
 
+    @Slot()
     def _on_tick(self):
         """
         Handle timer tick.
-        Calculates remaining time based on timestamps for accuracy.
+        Calculates remaining time from the monotonic clock, so wall-clock
+        adjustments (NTP, DST, manual changes) cannot skew the countdown.
         """
-        if not self.is_running:
+        if self._context.state not in _RUNNING_STATES:
             return
         
-        # Calculate elapsed time from timestamps (prevents drift)
-        now = int(time.time())
-        elapsed = now - self._context.session_start_ts - self._context.total_paused_seconds
-        self._context.remaining_seconds = max(0, self._context.total_seconds - elapsed)
+        # Whole seconds left until the phase deadline, rounded up
+        remaining = -((time.monotonic_ns() - self._deadline_ns) // NS_PER_SECOND)
+        if remaining < 0:
+            remaining = 0
         
-        # Emit tick for UI update
-        self.tick.emit(self._context)
+        # Emit tick for UI update, only when the displayed value changes
+        self._context.remaining_seconds = remaining
+        self._emit_tick()
         
         # Check if time is up
-        if self._context.remaining_seconds <= 0:
+        if remaining <= 0:
             self._on_phase_complete()
+        else:
+            self._schedule_tick()
+
+    def _emit_tick(self):
+        """Emit tick unless state and remaining time match the last emit."""
+        snapshot = (self._context.state, self._context.remaining_seconds)
+        if snapshot != self._last_emit:
+            self._last_emit = snapshot
+            self.tick.emit(self._context)
+
+    def _schedule_tick(self):
+        """Arm the tick timer for just past the next whole second of the countdown."""
+        remaining_ns = self._deadline_ns - time.monotonic_ns()
+        # Milliseconds until the next whole second, rounded up
+        delay_ms = ((remaining_ns - 1) % NS_PER_SECOND) // 1_000_000 + 1
+        self._qt_timer.start(delay_ms)
 
     def _on_phase_complete(self):
         """Handle completion of current phase."""
         self._qt_timer.stop()
         
         if self.is_focus:
-            # Focus session completed
-            self._save_session(completed=True, is_break=False)
-            
             # Check if we should auto-start break
-            settings = self.storage.get_settings()
+            settings = self._get_settings()
             if settings.auto_start_break:
+                # start_break() saves the completed focus session
                 self.start_break()
             else:
+                # Focus session completed
+                self._save_session(completed=True, is_break=False)
                 old_state = self._context.state
                 self._reset_to_idle()
                 self.phase_changed.emit(old_state, TimerState.IDLE)
                 
         elif self.is_break:
             # Break completed
-            settings = self.storage.get_settings()
+            settings = self._get_settings()
             if settings.log_breaks:
                 self._save_session(completed=True, is_break=True)
             
+            # Go idle first so start_focus() does not save the break again
+            # as interrupted
+            old_state = self._context.state
+            self._reset_to_idle()
+            self.phase_changed.emit(old_state, TimerState.IDLE)
+            
             # Check if we should auto-start focus
             if settings.auto_start_focus:
                 self.start_focus(
@@ -281,10 +339,6 @@ class TimerEngine(QObject):
                     self._context.break_minutes,
                     self._context.current_group_id
                 )
-            else:
-                old_state = self._context.state
-                self._reset_to_idle()
-                self.phase_changed.emit(old_state, TimerState.IDLE)
 
     def _stop_and_save(self, interrupted: bool):
         """Stop timer and save session."""
@@ -305,35 +359,28 @@ class TimerEngine(QObject):
         if was_focus:
             self._save_session(completed=not interrupted, is_break=False)
         elif was_break:
-            settings = self.storage.get_settings()
+            settings = self._get_settings()
             if settings.log_breaks:
                 self._save_session(completed=not interrupted, is_break=True)
         
         self._reset_to_idle()
         self.phase_changed.emit(old_state, TimerState.IDLE)
-        self.tick.emit(self._context)
+        self._emit_tick()
 
     def _save_session(self, completed: bool, is_break: bool):
         """Save the current session to storage."""
         now = int(time.time())
         
-        # Calculate actual seconds (accounting for pauses)
-        if self._context.pause_start_ts > 0:
-            # Currently paused
-            actual_seconds = (
-                self._context.pause_start_ts - 
-                self._current_session_start - 
-                self._context.total_paused_seconds
-            )
-        else:
-            actual_seconds = (
-                now - 
-                self._current_session_start - 
-                self._context.total_paused_seconds
-            )
+        # Calculate actual seconds up to now, or to the pause if paused
+        end_ns = self._context.pause_start_ns or time.monotonic_ns()
+        actual_seconds = self._elapsed_ns(end_ns) // NS_PER_SECOND
         
         # Ensure actual_seconds is non-negative and within bounds
-        actual_seconds = max(0, min(actual_seconds, self._current_planned_seconds))
+        planned = self._current_planned_seconds
+        if actual_seconds > planned:
+            actual_seconds = planned
+        elif actual_seconds < 0:
+            actual_seconds = 0
         
         session = Session(
             group_id=self._context.current_group_id or 0,
@@ -352,6 +399,22 @@ class TimerEngine(QObject):
         # Emit signal
         self.session_completed.emit(session)
 
+    def _get_settings(self) -> AppSettings:
+        """Get the application settings, reloading them after any save."""
+        version = self.storage.settings_version
+        if self._settings is None or version != self._settings_version:
+            self._settings = self.storage.get_settings()
+            self._settings_version = version
+        return self._settings
+
+    def invalidate_settings(self):
+        """Drop the cached settings so the next read reloads them."""
+        self._settings = None
+
+    def _elapsed_ns(self, now_ns: int) -> int:
+        """Get unpaused time in the current session up to a monotonic reading."""
+        return now_ns - self._context.session_start_ns - self._context.total_paused_ns
+
     def _reset_to_idle(self):
         """Reset context to idle state."""
         self._context.state = TimerState.IDLE
@@ -360,9 +423,13 @@ class TimerEngine(QObject):
         self._context.session_start_ts = 0
         self._context.pause_start_ts = 0
         self._context.total_paused_seconds = 0
+        self._context.session_start_ns = 0
+        self._context.pause_start_ns = 0
+        self._context.total_paused_ns = 0
         self._state_before_pause = None
         self._current_session_start = 0
         self._current_planned_seconds = 0
+        self._deadline_ns = 0
 
     def cleanup(self):
         """Cleanup resources. Call before application exit."""
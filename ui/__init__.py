@@ -1,8 +1,22 @@
 # UI module for Focus Timer application
-from .main_window import MainWindow
-from .timer_page import TimerPage
-from .history_page import HistoryPage
-from .groups_page import GroupsPage
-from .settings_page import SettingsPage
+import importlib
+
+# Pages are imported on first attribute access (PEP 562), so importing
+# one submodule does not load every page and its Qt widgets
+_LAZY = {
+    'MainWindow': '.main_window',
+    'TimerPage': '.timer_page',
+    'HistoryPage': '.history_page',
+    'GroupsPage': '.groups_page',
+    'SettingsPage': '.settings_page',
+}
 
 __all__ = ['MainWindow', 'TimerPage', 'HistoryPage', 'GroupsPage', 'SettingsPage']
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,14 +3,17 @@ Groups page widget for the Focus Timer application.
 Provides CRUD operations for managing focus categories/groups.
 """
 
-from typing import Optional, List
+from bisect import bisect_right
+from datetime import datetime
+from operator import attrgetter
+from typing import Optional, Dict, List
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QSpinBox, QTableWidget, QTableWidgetItem,
+    QLineEdit, QSpinBox, QTableView,
     QGroupBox, QMessageBox, QDialog, QDialogButtonBox,
     QFormLayout, QHeaderView, QColorDialog
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QColor
 
 from core.models import Group
@@ -135,6 +138,116 @@ class GroupEditDialog(QDialog):
         return self.group
 
 
+class GroupsModel(QAbstractTableModel):
+    """
+    Read-only table model over the list of groups, kept in name order
+    like Storage.get_all_groups.
+    """
+
+    HEADERS = ("Color", "Name", "Default Focus", "Default Break", "Created")
+    CENTERED_COLUMNS = frozenset((2, 3, 4))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        self._groups: List[Group] = []
+        # Color indicators by color name; reused across repaints and resets
+        self._colors: Dict[str, QColor] = {}
+
+    def set_groups(self, groups: List[Group]):
+        """Replace all groups and reset attached views."""
+        self.beginResetModel()
+        self._groups = groups
+        self.endResetModel()
+
+    def insert_group(self, group: Group) -> int:
+        """
+        Insert a group at its sorted position.
+        
+        Returns:
+            Row the group was inserted at.
+        """
+        row = bisect_right(self._groups, group.name, key=attrgetter('name'))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._groups.insert(row, group)
+        self.endInsertRows()
+        return row
+
+    def replace_group(self, row: int, group: Group):
+        """Replace the group in a row, moving it if its name sorts elsewhere."""
+        before = self._groups[row - 1].name if row > 0 else None
+        after = self._groups[row + 1].name if row + 1 < len(self._groups) else None
+        if (before is None or before <= group.name) and (after is None or group.name <= after):
+            self._groups[row] = group
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, len(self.HEADERS) - 1)
+            )
+        else:
+            self.remove_row(row)
+            self.insert_group(group)
+
+    def remove_row(self, row: int):
+        """Remove the group in a row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._groups[row]
+        self.endRemoveRows()
+
+    def group_at(self, row: int) -> Optional[Group]:
+        """Get the group shown in a given row."""
+        if 0 <= row < len(self._groups):
+            return self._groups[row]
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._groups)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        group = self._groups[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 1:
+                return group.name
+            if column == 2:
+                return f"{group.default_focus_minutes} min"
+            if column == 3:
+                return f"{group.default_break_minutes} min"
+            if column == 4:
+                return datetime.fromtimestamp(group.created_at).strftime("%Y-%m-%d")
+            return None
+        
+        if role == Qt.ItemDataRole.BackgroundRole and column == 0:
+            # Color indicator
+            color = self._colors.get(group.color)
+            if color is None:
+                color = self._colors[group.color] = QColor(group.color)
+            return color
+        
+        if role == Qt.ItemDataRole.UserRole:
+            return group.id
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole and column in self.CENTERED_COLUMNS:
+            return Qt.AlignmentFlag.AlignCenter
+        
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole
+    ):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class GroupsPage(QWidget):
     """
     Groups management page with CRUD operations.
@@ -143,6 +256,38 @@ class GroupsPage(QWidget):
     # Signal emitted when groups are modified
     groups_changed = Signal()
 
+    # Button stylesheets, shared by every instance
+    ADD_BUTTON_QSS = """
+        QPushButton {
+            background-color: #4CAF50;
+            color: white;
+            border: none;
+            border-radius: 3px;
+            padding: 8px 15px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #45a049;
+        }
+    """
+
+    DELETE_BUTTON_QSS = """
+        QPushButton {
+            background-color: #f44336;
+            color: white;
+            border: none;
+            border-radius: 3px;
+            padding: 8px 15px;
+        }
+        QPushButton:hover {
+            background-color: #da190b;
+        }
+        QPushButton:disabled {
+            background-color: #404040;
+            color: #606060;
+        }
+    """
+
     def __init__(self, storage: Storage, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
@@ -178,19 +323,7 @@ class GroupsPage(QWidget):
         toolbar_layout = QHBoxLayout()
         
         self.add_btn = QPushButton("+ Add Category")
-        self.add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 8px 15px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.add_btn.setStyleSheet(self.ADD_BUTTON_QSS)
         toolbar_layout.addWidget(self.add_btn)
 
         self.edit_btn = QPushButton("Edit")
@@ -199,33 +332,16 @@ class GroupsPage(QWidget):
 
         self.delete_btn = QPushButton("Delete")
         self.delete_btn.setEnabled(False)
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 8px 15px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-            QPushButton:disabled {
-                background-color: #404040;
-                color: #606060;
-            }
-        """)
+        self.delete_btn.setStyleSheet(self.DELETE_BUTTON_QSS)
         toolbar_layout.addWidget(self.delete_btn)
 
         toolbar_layout.addStretch()
         layout.addLayout(toolbar_layout)
 
         # Groups table
-        self.groups_table = QTableWidget()
-        self.groups_table.setColumnCount(5)
-        self.groups_table.setHorizontalHeaderLabels([
-            "Color", "Name", "Default Focus", "Default Break", "Created"
-        ])
+        self.groups_model = GroupsModel(self)
+        self.groups_table = QTableView()
+        self.groups_table.setModel(self.groups_model)
         self.groups_table.horizontalHeader().setSectionResizeMode(
             1, QHeaderView.ResizeMode.Stretch
         )
@@ -234,9 +350,11 @@ class GroupsPage(QWidget):
         self.groups_table.setColumnWidth(3, 120)
         self.groups_table.setColumnWidth(4, 120)
         self.groups_table.setAlternatingRowColors(True)
-        self.groups_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.groups_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.groups_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.groups_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.groups_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.groups_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.groups_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.groups_table.setWordWrap(False)
         layout.addWidget(self.groups_table)
 
     def _connect_signals(self):
@@ -244,7 +362,9 @@ class GroupsPage(QWidget):
         self.add_btn.clicked.connect(self._on_add)
         self.edit_btn.clicked.connect(self._on_edit)
         self.delete_btn.clicked.connect(self._on_delete)
-        self.groups_table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.groups_table.selectionModel().selectionChanged.connect(
+            self._on_selection_changed
+        )
         self.groups_table.doubleClicked.connect(self._on_edit)
 
     def refresh(self):
@@ -254,54 +374,21 @@ class GroupsPage(QWidget):
 
     def _populate_table(self):
         """Populate the table with groups data."""
-        self.groups_table.setRowCount(len(self._groups))
-        
-        for row, group in enumerate(self._groups):
-            # Color indicator
-            color_item = QTableWidgetItem()
-            color_item.setBackground(QColor(group.color))
-            color_item.setData(Qt.ItemDataRole.UserRole, group.id)
-            self.groups_table.setItem(row, 0, color_item)
-
-            # Name
-            name_item = QTableWidgetItem(group.name)
-            self.groups_table.setItem(row, 1, name_item)
-
-            # Default focus
-            focus_item = QTableWidgetItem(f"{group.default_focus_minutes} min")
-            focus_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.groups_table.setItem(row, 2, focus_item)
-
-            # Default break
-            break_item = QTableWidgetItem(f"{group.default_break_minutes} min")
-            break_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.groups_table.setItem(row, 3, break_item)
-
-            # Created date
-            from datetime import datetime
-            created = datetime.fromtimestamp(group.created_at)
-            created_item = QTableWidgetItem(created.strftime("%Y-%m-%d"))
-            created_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.groups_table.setItem(row, 4, created_item)
-
-    def _get_selected_group(self) -> Optional[Group]:
-        """Get the currently selected group."""
-        selected = self.groups_table.selectedItems()
+        self.groups_model.set_groups(self._groups)
+        # A model reset clears the selection without emitting selectionChanged
+        self._on_selection_changed()
+
+    def _get_selected_row(self) -> Optional[int]:
+        """Get the row of the currently selected group."""
+        selected = self.groups_table.selectionModel().selectedRows()
         if not selected:
             return None
-        
-        row = selected[0].row()
-        group_id = self.groups_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
-        
-        for group in self._groups:
-            if group.id == group_id:
-                return group
-        return None
+        return selected[0].row()
 
     @Slot()
     def _on_selection_changed(self):
         """Handle table selection change."""
-        has_selection = len(self.groups_table.selectedItems()) > 0
+        has_selection = self.groups_table.selectionModel().hasSelection()
         self.edit_btn.setEnabled(has_selection)
         self.delete_btn.setEnabled(has_selection)
 
@@ -312,8 +399,8 @@ class GroupsPage(QWidget):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             group = dialog.get_group()
             try:
-                self.storage.create_group(group)
-                self.refresh()
+                group.id = self.storage.create_group(group)
+                self.groups_model.insert_group(group)
                 self.groups_changed.emit()
             except Exception as e:
                 QMessageBox.critical(
@@ -325,7 +412,8 @@ class GroupsPage(QWidget):
     @Slot()
     def _on_edit(self):
         """Handle edit button click or double-click."""
-        group = self._get_selected_group()
+        row = self._get_selected_row()
+        group = self.groups_model.group_at(row) if row is not None else None
         if not group:
             return
         
@@ -344,7 +432,8 @@ class GroupsPage(QWidget):
             updated_group = dialog.get_group()
             try:
                 self.storage.update_group(updated_group)
-                self.refresh()
+                self.groups_model.replace_group(row, updated_group)
+                self._on_selection_changed()
                 self.groups_changed.emit()
             except Exception as e:
                 QMessageBox.critical(
@@ -356,7 +445,8 @@ class GroupsPage(QWidget):
     @Slot()
     def _on_delete(self):
         """Handle delete button click."""
-        group = self._get_selected_group()
+        row = self._get_selected_row()
+        group = self.groups_model.group_at(row) if row is not None else None
         if not group:
             return
         
@@ -373,7 +463,8 @@ class GroupsPage(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.storage.delete_group(group.id)
-                self.refresh()
+                self.groups_model.remove_row(row)
+                self._on_selection_changed()
                 self.groups_changed.emit()
             except Exception as e:
                 QMessageBox.critical(
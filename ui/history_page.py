@@ -3,30 +3,189 @@ History page widget for the Focus Timer application.
 Displays session history with filtering and export capabilities.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, List
+import time
+from datetime import date, datetime
+from functools import partial
+from typing import Optional, Callable, List, Dict, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QComboBox, QDateEdit, QTableWidget, QTableWidgetItem,
+    QComboBox, QDateEdit, QTableWidget, QTableWidgetItem, QTableView,
     QGroupBox, QMessageBox, QFileDialog, QHeaderView, QFrame
 )
-from PySide6.QtCore import Qt, QDate, Slot
+from PySide6.QtCore import Qt, QDate, QSignalBlocker, QTimer, Slot, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont, QColor
 
 from core.models import Session, Group
 from core.storage import Storage
 
 
+# Row shape returned by Storage.get_sessions_with_group
+SessionRow = Tuple[Session, Optional[str], Optional[str]]
+
+# Fetches one page of rows: (offset, limit) -> rows
+PageFetcher = Callable[[int, int], List[SessionRow]]
+
+
+class SessionsModel(QAbstractTableModel):
+    """
+    Read-only table model over session rows.
+    The view only asks for visible cells; each row is formatted once,
+    on first display. Rows are fetched a page at a time as the view
+    scrolls towards the end.
+    """
+
+    HEADERS = ("Date", "Category", "Start", "End", "Planned", "Actual", "Status")
+    STATUS_COLUMN = 6
+
+    COMPLETED_COLOR = QColor("#66BB6A")
+    INTERRUPTED_COLOR = QColor("#EF5350")
+
+    PAGE_SIZE = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        self._rows: List[SessionRow] = []
+        # Formatted cell text per row, filled in lazily by data()
+        self._display: List[Optional[Tuple[str, ...]]] = []
+        # "YYYY-MM-DD" per local (year, day of year); kept across resets
+        self._date_strings: Dict[Tuple[int, int], str] = {}
+        self._fetch_page: Optional[PageFetcher] = None
+        self._exhausted = True
+
+    def set_source(self, fetch_page: PageFetcher):
+        """
+        Replace all rows with those of a new query and reset attached views.
+        
+        Args:
+            fetch_page: Callable returning the rows at (offset, limit).
+        """
+        self.beginResetModel()
+        self._fetch_page = fetch_page
+        self._rows = fetch_page(0, self.PAGE_SIZE)
+        self._display = [None] * len(self._rows)
+        # A short page means the query has no more rows
+        self._exhausted = len(self._rows) < self.PAGE_SIZE
+        self.endResetModel()
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        
+        first = len(self._rows)
+        batch = self._fetch_page(first, self.PAGE_SIZE)
+        self._exhausted = len(batch) < self.PAGE_SIZE
+        if not batch:
+            return
+        
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self._rows += batch
+        self._display += [None] * len(batch)
+        self.endInsertRows()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            cells = self._display[row]
+            if cells is None:
+                cells = self._display[row] = self._format_row(self._rows[row])
+            return cells[index.column()]
+        
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == self.STATUS_COLUMN:
+            if self._rows[row][0].status == "completed":
+                return self.COMPLETED_COLOR
+            return self.INTERRUPTED_COLOR
+        
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole
+    ):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def _format_row(self, row: SessionRow) -> Tuple[str, ...]:
+        """Format the display text of every column of a row."""
+        session, group_name, _ = row
+        start = time.localtime(session.start_ts)
+        end = time.localtime(session.end_ts)
+        
+        # Most sessions share a day with their neighbours
+        day_key = (start.tm_year, start.tm_yday)
+        date_str = self._date_strings.get(day_key)
+        if date_str is None:
+            date_str = f"{start.tm_year:04d}-{start.tm_mon:02d}-{start.tm_mday:02d}"
+            self._date_strings[day_key] = date_str
+        
+        return (
+            date_str,
+            group_name or "Unknown",
+            f"{start.tm_hour:02d}:{start.tm_min:02d}",
+            f"{end.tm_hour:02d}:{end.tm_min:02d}",
+            f"{session.planned_seconds // 60} min",
+            f"{session.actual_seconds // 60} min",
+            session.status.capitalize(),
+        )
+
+
 class HistoryPage(QWidget):
     """
     History page showing session records with filtering and statistics.
     """
 
+    # Stylesheets shared by every instance
+    EXPORT_BUTTON_QSS = """
+        QPushButton {
+            background-color: #2196F3;
+            color: white;
+            border: none;
+            border-radius: 3px;
+            padding: 5px 10px;
+        }
+        QPushButton:hover {
+            background-color: #1976D2;
+        }
+    """
+    STAT_CAPTION_QSS = "color: #a0a0a0; font-size: 13px;"
+
+    FILTER_DEBOUNCE_MS = 150
+
     def __init__(self, storage: Storage, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
         self.storage = storage
+        # Category colors by color name, reused across refreshes
+        self._group_colors: Dict[str, QColor] = {}
         self._groups: List[Group] = []
+        # Storage.groups_version the filter combo was last built from
+        self._groups_version: Optional[int] = None
+        # Inputs the page, statistics and category totals were last
+        # computed from
+        self._refresh_key: Optional[tuple] = None
+        self._stats_key: Optional[tuple] = None
+        self._totals_key: Optional[tuple] = None
+        
+        # Coalesces bursts of filter changes into one query
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
         
         self._setup_ui()
         self._connect_signals()
@@ -45,7 +204,7 @@ class HistoryPage(QWidget):
         # Today's total
         today_layout = QVBoxLayout()
         today_label = QLabel("Today")
-        today_label.setStyleSheet("color: #a0a0a0; font-size: 13px;")
+        today_label.setStyleSheet(self.STAT_CAPTION_QSS)
         today_layout.addWidget(today_label)
         self.today_total_label = QLabel("0h 0m")
         today_font = QFont()
@@ -59,7 +218,7 @@ class HistoryPage(QWidget):
         # This week's total
         week_layout = QVBoxLayout()
         week_label = QLabel("This Week")
-        week_label.setStyleSheet("color: #a0a0a0; font-size: 13px;")
+        week_label.setStyleSheet(self.STAT_CAPTION_QSS)
         week_layout.addWidget(week_label)
         self.week_total_label = QLabel("0h 0m")
         self.week_total_label.setFont(today_font)
@@ -70,7 +229,7 @@ class HistoryPage(QWidget):
         # Total sessions
         sessions_layout = QVBoxLayout()
         sessions_label = QLabel("Sessions Today")
-        sessions_label.setStyleSheet("color: #a0a0a0; font-size: 13px;")
+        sessions_label.setStyleSheet(self.STAT_CAPTION_QSS)
         sessions_layout.addWidget(sessions_label)
         self.sessions_count_label = QLabel("0")
         self.sessions_count_label.setFont(today_font)
@@ -93,6 +252,8 @@ class HistoryPage(QWidget):
         self.group_table.setAlternatingRowColors(True)
         self.group_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.group_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.group_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.group_table.setWordWrap(False)
         group_layout.addWidget(self.group_table)
         
         layout.addWidget(group_box)
@@ -129,211 +290,199 @@ class HistoryPage(QWidget):
 
         self.export_btn = QPushButton("Export CSV")
         self.export_btn.setMinimumWidth(100)
-        self.export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 5px 10px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
+        self.export_btn.setStyleSheet(self.EXPORT_BUTTON_QSS)
         filter_layout.addWidget(self.export_btn)
 
         filter_layout.addStretch()
         layout.addLayout(filter_layout)
 
-        # Sessions table
-        self.sessions_table = QTableWidget()
-        self.sessions_table.setColumnCount(7)
-        self.sessions_table.setHorizontalHeaderLabels([
-            "Date", "Category", "Start", "End", 
-            "Planned", "Actual", "Status"
-        ])
+        # Sessions table (model/view: cells are formatted only when shown)
+        self.sessions_model = SessionsModel(self)
+        self.sessions_table = QTableView()
+        self.sessions_table.setModel(self.sessions_model)
         self.sessions_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.sessions_table.setAlternatingRowColors(True)
-        self.sessions_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.sessions_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.sessions_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.sessions_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.sessions_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.sessions_table.setWordWrap(False)
         layout.addWidget(self.sessions_table)
 
     def _connect_signals(self):
         """Connect widget signals."""
-        self.filter_btn.clicked.connect(self._apply_filter)
+        self.filter_btn.clicked.connect(self._schedule_filter)
+        self.filter_group_combo.currentIndexChanged.connect(self._schedule_filter)
+        self.start_date.dateChanged.connect(self._schedule_filter)
+        self.end_date.dateChanged.connect(self._schedule_filter)
         self.export_btn.clicked.connect(self._export_csv)
 
     def refresh(self):
-        """Refresh all data on the page."""
+        """Refresh all data on the page, if any of it may have changed."""
+        # Filter edits apply themselves, so only new data or a new day
+        # can make the page stale
+        key = (
+            self.storage.sessions_version, self.storage.groups_version,
+            date.today()
+        )
+        if key == self._refresh_key:
+            return
+        self._refresh_key = key
+        
         self._load_groups()
         self._update_statistics()
-        self._update_group_totals()
+        # Also updates the group totals
         self._apply_filter()
 
+    def _filter_dates(self) -> Tuple[datetime, datetime]:
+        """Get the start of the From day and the end of the To day."""
+        start = self.start_date.date()
+        end = self.end_date.date()
+        return (
+            datetime(start.year(), start.month(), start.day()),
+            datetime(end.year(), end.month(), end.day(), 23, 59, 59)
+        )
+
     def _load_groups(self):
         """Load groups for filter combo."""
+        # Skip the query and the combo rebuild if no group has changed
+        version = self.storage.groups_version
+        if version == self._groups_version:
+            return
+        self._groups_version = version
+        
         self._groups = self.storage.get_all_groups()
         current_data = self.filter_group_combo.currentData()
         
-        self.filter_group_combo.clear()
-        self.filter_group_combo.addItem("All Categories", None)
-        for group in self._groups:
-            self.filter_group_combo.addItem(group.name, group.id)
-        
-        # Restore selection if possible
-        if current_data is not None:
-            for i in range(self.filter_group_combo.count()):
-                if self.filter_group_combo.itemData(i) == current_data:
-                    self.filter_group_combo.setCurrentIndex(i)
-                    break
+        # The intermediate index changes are not user filter changes;
+        # refresh() applies the filter once afterwards
+        with QSignalBlocker(self.filter_group_combo):
+            self.filter_group_combo.clear()
+            self.filter_group_combo.addItem("All Categories", None)
+            for group in self._groups:
+                self.filter_group_combo.addItem(group.name, group.id)
+            
+            # Restore selection if possible
+            if current_data is not None:
+                index = self.filter_group_combo.findData(current_data)
+                if index >= 0:
+                    self.filter_group_combo.setCurrentIndex(index)
 
     def _update_statistics(self):
         """Update today/week statistics."""
+        # Unchanged until a session is saved or the day rolls over
+        key = (self.storage.sessions_version, date.today())
+        if key == self._stats_key:
+            return
+        self._stats_key = key
+
+        today_seconds, week_seconds, today_count = self.storage.get_period_stats()
+
         # Today's total
-        today_seconds = self.storage.get_today_total_seconds()
         hours = today_seconds // 3600
         minutes = (today_seconds % 3600) // 60
         self.today_total_label.setText(f"{hours}h {minutes}m")
 
         # This week's total
-        week_seconds = self.storage.get_week_total_seconds()
         hours = week_seconds // 3600
         minutes = (week_seconds % 3600) // 60
         self.week_total_label.setText(f"{hours}h {minutes}m")
 
         # Today's session count
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        tomorrow = today + timedelta(days=1)
-        sessions = self.storage.get_sessions(
-            start_date=today,
-            end_date=tomorrow,
-            limit=1000
-        )
-        self.sessions_count_label.setText(str(len(sessions)))
-
-    def _update_group_totals(self):
-        """Update group totals table."""
-        # Get totals for the current filter period
-        start_date = datetime(
-            self.start_date.date().year(),
-            self.start_date.date().month(),
-            self.start_date.date().day()
-        )
-        end_date = datetime(
-            self.end_date.date().year(),
-            self.end_date.date().month(),
-            self.end_date.date().day(),
-            23, 59, 59
+        self.sessions_count_label.setText(str(today_count))
+
+    def _update_group_totals(self, start_date: datetime, end_date: datetime):
+        """Update group totals table for the given filter period."""
+        # Category names and colors show in the table too
+        key = (
+            self.storage.sessions_version, self.storage.groups_version,
+            start_date, end_date
         )
+        if key == self._totals_key:
+            return
+        self._totals_key = key
 
         totals = self.storage.get_group_totals(start_date, end_date)
 
-        self.group_table.setRowCount(len(totals))
-        for row, (group, total_seconds, session_count) in enumerate(totals):
-            # Category name with color indicator
-            name_item = QTableWidgetItem(group.name)
-            name_item.setForeground(QColor(group.color))
-            self.group_table.setItem(row, 0, name_item)
-
-            # Total time
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            time_item = QTableWidgetItem(f"{hours}h {minutes}m")
-            self.group_table.setItem(row, 1, time_item)
+        # Repaint once after all items are set, not once per setItem()
+        self.group_table.setUpdatesEnabled(False)
+        try:
+            # Rows kept by setRowCount keep their items, which are reused
+            self.group_table.setRowCount(len(totals))
+            for row, (group, total_seconds, session_count) in enumerate(totals):
+                # Category name with color indicator
+                name_item = self._group_table_item(row, 0, group.name)
+                color = self._group_colors.get(group.color)
+                if color is None:
+                    color = self._group_colors[group.color] = QColor(group.color)
+                name_item.setForeground(color)
+
+                # Total time
+                hours = total_seconds // 3600
+                minutes = (total_seconds % 3600) // 60
+                self._group_table_item(row, 1, f"{hours}h {minutes}m")
+
+                # Session count
+                self._group_table_item(row, 2, str(session_count))
+        finally:
+            self.group_table.setUpdatesEnabled(True)
+
+    def _group_table_item(self, row: int, column: int, text: str) -> QTableWidgetItem:
+        """Set a group totals cell's text, creating its item only if missing."""
+        item = self.group_table.item(row, column)
+        if item is None:
+            item = QTableWidgetItem(text)
+            self.group_table.setItem(row, column, item)
+        elif item.text() != text:
+            item.setText(text)
+        return item
 
-            # Session count
-            count_item = QTableWidgetItem(str(session_count))
-            self.group_table.setItem(row, 2, count_item)
+    @Slot()
+    def _schedule_filter(self):
+        """Apply the filters once changes have settled."""
+        self._filter_timer.start()
 
     @Slot()
     def _apply_filter(self):
         """Apply date and group filters to sessions table."""
+        # Covers any change still waiting on the debounce timer
+        self._filter_timer.stop()
+
         # Parse dates
-        start_date = datetime(
-            self.start_date.date().year(),
-            self.start_date.date().month(),
-            self.start_date.date().day()
-        )
-        end_date = datetime(
-            self.end_date.date().year(),
-            self.end_date.date().month(),
-            self.end_date.date().day(),
-            23, 59, 59
-        )
+        start_date, end_date = self._filter_dates()
 
         # Get group filter
         group_id = self.filter_group_combo.currentData()
 
-        # Fetch sessions
-        sessions = self.storage.get_sessions(
+        # Populate table; further pages load as the table is scrolled
+        self.sessions_model.set_source(partial(
+            self._fetch_sessions_page, group_id, start_date, end_date
+        ))
+
+        # Update group totals for the filter period
+        self._update_group_totals(start_date, end_date)
+
+    def _fetch_sessions_page(
+        self,
+        group_id: Optional[int],
+        start_date: datetime,
+        end_date: datetime,
+        offset: int,
+        limit: int
+    ) -> List[SessionRow]:
+        """Fetch one page of sessions for the given filter."""
+        return self.storage.get_sessions_with_group(
             group_id=group_id,
             start_date=start_date,
             end_date=end_date,
-            limit=500
+            limit=limit,
+            offset=offset
         )
 
-        # Build group name lookup
-        group_names = {g.id: g.name for g in self._groups}
-
-        # Populate table
-        self.sessions_table.setRowCount(len(sessions))
-        for row, session in enumerate(sessions):
-            # Date
-            dt = datetime.fromtimestamp(session.start_ts)
-            date_item = QTableWidgetItem(dt.strftime("%Y-%m-%d"))
-            self.sessions_table.setItem(row, 0, date_item)
-
-            # Category
-            group_name = group_names.get(session.group_id, "Unknown")
-            group_item = QTableWidgetItem(group_name)
-            self.sessions_table.setItem(row, 1, group_item)
-
-            # Start time
-            start_item = QTableWidgetItem(dt.strftime("%H:%M"))
-            self.sessions_table.setItem(row, 2, start_item)
-
-            # End time
-            end_dt = datetime.fromtimestamp(session.end_ts)
-            end_item = QTableWidgetItem(end_dt.strftime("%H:%M"))
-            self.sessions_table.setItem(row, 3, end_item)
-
-            # Planned duration
-            planned_min = session.planned_seconds // 60
-            planned_item = QTableWidgetItem(f"{planned_min} min")
-            self.sessions_table.setItem(row, 4, planned_item)
-
-            # Actual duration
-            actual_min = session.actual_seconds // 60
-            actual_item = QTableWidgetItem(f"{actual_min} min")
-            self.sessions_table.setItem(row, 5, actual_item)
-
-            # Status
-            status_item = QTableWidgetItem(session.status.capitalize())
-            if session.status == "completed":
-                status_item.setForeground(QColor("#66BB6A"))
-            else:
-                status_item.setForeground(QColor("#EF5350"))
-            self.sessions_table.setItem(row, 6, status_item)
-
-        # Update group totals for the filter period
-        self._update_group_totals()
-
     @Slot()
     def _export_csv(self):
         """Export filtered sessions to CSV file."""
         # Get current filter settings
-        start_date = datetime(
-            self.start_date.date().year(),
-            self.start_date.date().month(),
-            self.start_date.date().day()
-        )
-        end_date = datetime(
-            self.end_date.date().year(),
-            self.end_date.date().month(),
-            self.end_date.date().day(),
-            23, 59, 59
-        )
+        start_date, end_date = self._filter_dates()
         group_id = self.filter_group_combo.currentData()
 
         # Get save path
@@ -3,30 +3,55 @@ Main window for the Focus Timer application.
 Contains the tab widget with all pages.
 """
 
-from typing import Optional
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Callable, Dict
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QTabWidget,
     QSystemTrayIcon, QMenu, QApplication, QMessageBox
 )
-from PySide6.QtCore import Qt, Slot, QSize
+from PySide6.QtCore import Qt, Slot, QSize, QSignalBlocker
 from PySide6.QtGui import QIcon, QAction, QCloseEvent, QPixmap, QPainter, QColor
 
-from core.models import TimerState, TimerContext, Session
+from core.models import TimerState, TimerContext, Session, AppSettings
 from core.storage import Storage
 from core.timer_engine import TimerEngine
 from core.keep_awake import get_keep_awake_manager
 from core.notifications import get_notification_manager
 
 from .timer_page import TimerPage
-from .history_page import HistoryPage
-from .groups_page import GroupsPage
 from .settings_page import SettingsPage
 
+# History and Categories are imported when their tab is first shown
+if TYPE_CHECKING:
+    from .history_page import HistoryPage
+    from .groups_page import GroupsPage
 
+
+APP_ICON_SVG = Path(__file__).parent / 'resources' / 'app_icon.svg'
+
+
+@cache
 def create_app_icon() -> QIcon:
+    """
+    Get the app icon, created once per process.
+    Loaded from the bundled SVG, which Qt rasterizes at each requested
+    size on demand; painted in code if the SVG cannot be loaded.
+    """
+    if APP_ICON_SVG.is_file():
+        icon = QIcon(str(APP_ICON_SVG))
+        if not icon.isNull():
+            return icon
+    return _paint_app_icon()
+
+
+def _paint_app_icon() -> QIcon:
     """Create a simple app icon programmatically."""
     sizes = [16, 32, 48, 64]
     icon = QIcon()
+    # Brush colors are the same for every size
+    green = QColor("#4CAF50")
+    white = QColor("white")
     
     for size in sizes:
         pixmap = QPixmap(size, size)
@@ -37,20 +62,20 @@ def create_app_icon() -> QIcon:
         
         # Draw a timer circle
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor("#4CAF50"))
+        painter.setBrush(green)
         margin = size // 8
         painter.drawEllipse(margin, margin, size - 2*margin, size - 2*margin)
         
         # Draw inner circle (white)
         inner_margin = size // 4
-        painter.setBrush(QColor("white"))
+        painter.setBrush(white)
         painter.drawEllipse(
             inner_margin, inner_margin,
             size - 2*inner_margin, size - 2*inner_margin
         )
         
         # Draw timer hand
-        painter.setBrush(QColor("#4CAF50"))
+        painter.setBrush(green)
         center = size // 2
         hand_width = max(1, size // 10)
         painter.drawRect(
@@ -71,6 +96,25 @@ class MainWindow(QMainWindow):
     Main application window with tabbed interface.
     """
 
+    PHASE_NAMES = {
+        TimerState.IDLE: "Idle",
+        TimerState.FOCUS: "Focus",
+        TimerState.BREAK: "Break",
+        TimerState.PAUSED: "Paused",
+    }
+    # Tray tooltip text before the remaining time, per state
+    TOOLTIP_PREFIXES = {
+        state: f"Focus Timer - {name}\n" for state, name in PHASE_NAMES.items()
+    }
+    # Tray menu per state: (start enabled, pause enabled, pause text,
+    # stop enabled)
+    TRAY_MENU_STATES = {
+        TimerState.IDLE: (True, False, "Pause", False),
+        TimerState.FOCUS: (False, True, "Pause", True),
+        TimerState.BREAK: (False, True, "Pause", True),
+        TimerState.PAUSED: (False, True, "Resume", True),
+    }
+
     def __init__(self):
         super().__init__()
         
@@ -87,6 +131,15 @@ class MainWindow(QMainWindow):
         self.app_icon = create_app_icon()
         self.setWindowIcon(self.app_icon)
         
+        # Stays None when the system has no tray
+        self.tray_icon: Optional[QSystemTrayIcon] = None
+        # Whether the "still running" balloon was shown since the window
+        # was last brought back
+        self._tray_minimize_notified = False
+        # Tray Quit cleans up, then QApplication.quit() closes the window,
+        # which would clean up a second time
+        self._cleaned_up = False
+        
         self._setup_ui()
         self._setup_tray()
         self._connect_signals()
@@ -107,27 +160,66 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.tabs.setDocumentMode(True)
         
-        # Create pages
+        # Create pages. History and Categories are built the first time
+        # their tab is shown; Settings applies the stored settings when
+        # constructed, so it is built up front
         self.timer_page = TimerPage(self.storage, self.timer_engine)
-        self.history_page = HistoryPage(self.storage)
-        self.groups_page = GroupsPage(self.storage)
+        self.history_page: Optional['HistoryPage'] = None
+        self.groups_page: Optional['GroupsPage'] = None
         self.settings_page = SettingsPage(self.storage)
         
-        # Add tabs
+        # Add tabs, with placeholders for the deferred pages
         self.tabs.addTab(self.timer_page, "Timer")
-        self.tabs.addTab(self.history_page, "History")
-        self.tabs.addTab(self.groups_page, "Categories")
+        history_index = self.tabs.addTab(QWidget(), "History")
+        groups_index = self.tabs.addTab(QWidget(), "Categories")
         self.tabs.addTab(self.settings_page, "Settings")
+        self._page_factories: Dict[int, Callable[[], QWidget]] = {
+            history_index: self._create_history_page,
+            groups_index: self._create_groups_page,
+        }
         
         layout.addWidget(self.tabs)
 
+    def _create_history_page(self) -> 'HistoryPage':
+        """Build the History page."""
+        from .history_page import HistoryPage
+        
+        self.history_page = HistoryPage(self.storage)
+        return self.history_page
+
+    def _create_groups_page(self) -> 'GroupsPage':
+        """Build and load the Categories page."""
+        from .groups_page import GroupsPage
+        
+        self.groups_page = GroupsPage(self.storage)
+        self.groups_page.groups_changed.connect(self._on_groups_changed)
+        self.groups_page.refresh()
+        return self.groups_page
+
+    def _ensure_page(self, index: int):
+        """Replace a tab's placeholder with its real page, if not done yet."""
+        factory = self._page_factories.pop(index, None)
+        if factory is None:
+            return
+        
+        placeholder = self.tabs.widget(index)
+        text = self.tabs.tabText(index)
+        page = factory()
+        # Swapping the tab is not a user tab change
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, page, text)
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+
     def _setup_tray(self):
         """Set up system tray icon."""
         if not QSystemTrayIcon.isSystemTrayAvailable():
             return
         
         self.tray_icon = QSystemTrayIcon(self.app_icon, self)
-        self.tray_icon.setToolTip("Focus Timer")
+        self._tray_tooltip = "Focus Timer"
+        self.tray_icon.setToolTip(self._tray_tooltip)
         
         # Create tray menu
         tray_menu = QMenu()
@@ -151,6 +243,8 @@ class MainWindow(QMainWindow):
         self.tray_stop_action.triggered.connect(self._tray_stop)
         self.tray_stop_action.setEnabled(False)
         tray_menu.addAction(self.tray_stop_action)
+        # The actions above start out in the idle layout
+        self._tray_menu_state = self.TRAY_MENU_STATES[TimerState.IDLE]
         
         tray_menu.addSeparator()
         
@@ -168,39 +262,36 @@ class MainWindow(QMainWindow):
 
     def _connect_signals(self):
         """Connect signals from various components."""
-        # Timer engine signals
-        self.timer_engine.tick.connect(self._on_timer_tick)
+        # Timer engine signals; ticks only update the tray tooltip
+        if self.tray_icon is not None:
+            self.timer_engine.tick.connect(self._on_timer_tick)
         self.timer_engine.phase_changed.connect(self._on_phase_changed)
         self.timer_engine.session_completed.connect(self._on_session_completed)
         
-        # Groups page signal
-        self.groups_page.groups_changed.connect(self._on_groups_changed)
+        # Settings page signal
+        self.settings_page.settings_changed.connect(self._on_settings_changed)
         
         # Tab changed
         self.tabs.currentChanged.connect(self._on_tab_changed)
 
     def _refresh_all(self):
-        """Refresh all pages."""
-        self.history_page.refresh()
-        self.groups_page.refresh()
+        """Refresh all pages that have been built."""
+        for page in (self.history_page, self.groups_page):
+            if page is not None:
+                page.refresh()
 
     @Slot(TimerContext)
     def _on_timer_tick(self, context: TimerContext):
         """Handle timer tick for tray updates."""
-        if hasattr(self, 'tray_icon'):
-            phase_name = {
-                TimerState.IDLE: "Idle",
-                TimerState.FOCUS: "Focus",
-                TimerState.BREAK: "Break",
-                TimerState.PAUSED: "Paused",
-            }.get(context.state, "")
-            
-            if context.state != TimerState.IDLE:
-                self.tray_icon.setToolTip(
-                    f"Focus Timer - {phase_name}\n{context.format_remaining()}"
-                )
-            else:
-                self.tray_icon.setToolTip("Focus Timer")
+        if context.state != TimerState.IDLE:
+            tooltip = self.TOOLTIP_PREFIXES[context.state] + context.format_remaining()
+        else:
+            tooltip = "Focus Timer"
+        
+        # Only touch the tray when the text actually changes
+        if tooltip != self._tray_tooltip:
+            self.tray_icon.setToolTip(tooltip)
+            self._tray_tooltip = tooltip
 
     @Slot(TimerState, TimerState)
     def _on_phase_changed(self, old_state: TimerState, new_state: TimerState):
@@ -227,15 +318,20 @@ class MainWindow(QMainWindow):
             # Keep awake even when paused (user might resume soon)
             pass  # Don't stop keep_awake when paused
         
-        # Update tray menu
-        if hasattr(self, 'tray_icon'):
-            is_running = new_state in (TimerState.FOCUS, TimerState.BREAK)
-            is_paused = new_state == TimerState.PAUSED
+        # Update tray menu, touching only the parts that change
+        if self.tray_icon is not None:
+            start, pause, pause_text, stop = self.TRAY_MENU_STATES[new_state]
+            old_start, old_pause, old_pause_text, old_stop = self._tray_menu_state
             
-            self.tray_start_action.setEnabled(new_state == TimerState.IDLE)
-            self.tray_pause_action.setEnabled(is_running or is_paused)
-            self.tray_pause_action.setText("Resume" if is_paused else "Pause")
-            self.tray_stop_action.setEnabled(is_running or is_paused)
+            if start != old_start:
+                self.tray_start_action.setEnabled(start)
+            if pause != old_pause:
+                self.tray_pause_action.setEnabled(pause)
+            if pause_text != old_pause_text:
+                self.tray_pause_action.setText(pause_text)
+            if stop != old_stop:
+                self.tray_stop_action.setEnabled(stop)
+            self._tray_menu_state = (start, pause, pause_text, stop)
 
     @Slot(Session)
     def _on_session_completed(self, session: Session):
@@ -250,9 +346,16 @@ class MainWindow(QMainWindow):
         # Refresh timer page groups
         self.timer_page.refresh_groups()
 
+    @Slot(AppSettings)
+    def _on_settings_changed(self, settings: AppSettings):
+        """Handle settings modification."""
+        # Timer engine reloads its cached settings on next use
+        self.timer_engine.invalidate_settings()
+
     @Slot(int)
     def _on_tab_changed(self, index: int):
         """Handle tab change."""
+        self._ensure_page(index)
         widget = self.tabs.widget(index)
         if widget == self.history_page:
             self.history_page.refresh()
@@ -266,6 +369,7 @@ class MainWindow(QMainWindow):
     @Slot()
     def _show_window(self):
         """Show and bring window to front."""
+        self._tray_minimize_notified = False
         self.show()
         self.raise_()
         self.activateWindow()
@@ -301,15 +405,17 @@ class MainWindow(QMainWindow):
         """Handle window close event."""
         # Minimize to tray instead of closing if timer is running
         if self.timer_engine.is_running or self.timer_engine.is_paused:
-            if hasattr(self, 'tray_icon') and self.tray_icon.isVisible():
+            if self.tray_icon is not None and self.tray_icon.isVisible():
                 event.ignore()
                 self.hide()
-                self.tray_icon.showMessage(
-                    "Focus Timer",
-                    "Timer still running. Click tray icon to show window.",
-                    QSystemTrayIcon.MessageIcon.Information,
-                    2000
-                )
+                if not self._tray_minimize_notified:
+                    self.tray_icon.showMessage(
+                        "Focus Timer",
+                        "Timer still running. Click tray icon to show window.",
+                        QSystemTrayIcon.MessageIcon.Information,
+                        2000
+                    )
+                    self._tray_minimize_notified = True
                 return
         
         # Otherwise, ask for confirmation if timer is running
@@ -330,6 +436,13 @@ class MainWindow(QMainWindow):
 
     def _cleanup(self):
         """Clean up resources before exit."""
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
+        
+        # Save pending timer options
+        self.timer_page.flush_options()
+        
         # Stop timer and save session
         self.timer_engine.cleanup()
         
@@ -342,5 +455,9 @@ class MainWindow(QMainWindow):
         notif.cleanup()
         
         # Hide tray icon
-        if hasattr(self, 'tray_icon'):
+        if self.tray_icon is not None:
             self.tray_icon.hide()
+        
+        # Tidy and close the database
+        self.storage.maintenance()
+        self.storage.close()
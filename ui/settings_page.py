@@ -3,16 +3,16 @@ Settings page widget for the Focus Timer application.
 Allows users to configure application behavior.
 """
 
-from typing import Optional
+from typing import Optional, List, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox,
     QGroupBox, QPushButton, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, QSignalBlocker, Signal, Slot
 from PySide6.QtGui import QFont
 
 from core.models import AppSettings
-from core.storage import Storage
+from core.storage import Storage, get_app_data_dir
 from core.keep_awake import get_keep_awake_manager
 from core.notifications import get_notification_manager
 
@@ -119,7 +119,6 @@ class SettingsPage(QWidget):
         data_layout.addWidget(data_info)
 
         # Show data location
-        from core.storage import get_app_data_dir
         data_path = get_app_data_dir()
         path_label = QLabel(f"Location: {data_path}")
         path_label.setStyleSheet("color: #808080; font-size: 11px;")
@@ -149,65 +148,56 @@ class SettingsPage(QWidget):
         # Spacer
         layout.addStretch()
 
+        # Each checkbox and the AppSettings field it edits
+        self._setting_fields: List[Tuple[QCheckBox, str]] = [
+            (self.auto_break_check, 'auto_start_break'),
+            (self.auto_focus_check, 'auto_start_focus'),
+            (self.sound_check, 'sound_enabled'),
+            (self.notification_check, 'notification_enabled'),
+            (self.keep_awake_check, 'keep_screen_awake'),
+            (self.log_breaks_check, 'log_breaks'),
+        ]
+
     def _connect_signals(self):
         """Connect widget signals."""
-        self.auto_break_check.toggled.connect(self._on_setting_changed)
-        self.auto_focus_check.toggled.connect(self._on_setting_changed)
-        self.sound_check.toggled.connect(self._on_setting_changed)
-        self.notification_check.toggled.connect(self._on_setting_changed)
-        self.keep_awake_check.toggled.connect(self._on_setting_changed)
-        self.log_breaks_check.toggled.connect(self._on_setting_changed)
+        for checkbox, _ in self._setting_fields:
+            checkbox.toggled.connect(self._on_setting_changed)
 
     def _load_settings(self):
         """Load settings from storage."""
         self._settings = self.storage.get_settings()
         
-        # Block signals while loading to prevent save loops
-        for checkbox in [
-            self.auto_break_check, self.auto_focus_check,
-            self.sound_check, self.notification_check,
-            self.keep_awake_check, self.log_breaks_check
-        ]:
-            checkbox.blockSignals(True)
-        
-        self.auto_break_check.setChecked(self._settings.auto_start_break)
-        self.auto_focus_check.setChecked(self._settings.auto_start_focus)
-        self.sound_check.setChecked(self._settings.sound_enabled)
-        self.notification_check.setChecked(self._settings.notification_enabled)
-        self.keep_awake_check.setChecked(self._settings.keep_screen_awake)
-        self.log_breaks_check.setChecked(self._settings.log_breaks)
-        
-        # Unblock signals
-        for checkbox in [
-            self.auto_break_check, self.auto_focus_check,
-            self.sound_check, self.notification_check,
-            self.keep_awake_check, self.log_breaks_check
-        ]:
-            checkbox.blockSignals(False)
+        # Block signals while loading to prevent save loops; each
+        # blocker restores its checkbox even if setting a value raises
+        for checkbox, attr in self._setting_fields:
+            with QSignalBlocker(checkbox):
+                checkbox.setChecked(getattr(self._settings, attr))
         
         # Apply settings to managers
         self._apply_settings()
 
     def _apply_settings(self):
         """Apply settings to the relevant managers."""
+        # Only assign values that changed, skipping redundant setter calls
+        settings = self._settings
+        
         # Keep awake manager
         keep_awake = get_keep_awake_manager()
-        keep_awake.enabled = self._settings.keep_screen_awake
+        if keep_awake.enabled != settings.keep_screen_awake:
+            keep_awake.enabled = settings.keep_screen_awake
         
         # Notification manager
         notif_manager = get_notification_manager()
-        notif_manager.sound_enabled = self._settings.sound_enabled
-        notif_manager.notification_enabled = self._settings.notification_enabled
+        if notif_manager.sound_enabled != settings.sound_enabled:
+            notif_manager.sound_enabled = settings.sound_enabled
+        if notif_manager.notification_enabled != settings.notification_enabled:
+            notif_manager.notification_enabled = settings.notification_enabled
 
     @Slot()
     def _on_setting_changed(self):
         """Handle settings change."""
-        self._settings.auto_start_break = self.auto_break_check.isChecked()
-        self._settings.auto_start_focus = self.auto_focus_check.isChecked()
-        self._settings.sound_enabled = self.sound_check.isChecked()
-        self._settings.notification_enabled = self.notification_check.isChecked()
-        self._settings.keep_screen_awake = self.keep_awake_check.isChecked()
-        self._settings.log_breaks = self.log_breaks_check.isChecked()
+        for checkbox, attr in self._setting_fields:
+            setattr(self._settings, attr, checkbox.isChecked())
         
         # Save to storage
         self.storage.save_settings(self._settings)
@@ -3,13 +3,13 @@ Timer page widget for the Focus Timer application.
 Contains the main timer display, controls, and preset selection.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Dict
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QComboBox, QSpinBox, QGroupBox, QCheckBox, QFrame,
     QSizePolicy
 )
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, QSignalBlocker, QTimer, Slot
 from PySide6.QtGui import QFont
 
 from core.models import TimerState, TimerContext, Group, DEFAULT_PRESETS, AppSettings
@@ -22,6 +22,72 @@ class TimerPage(QWidget):
     Main timer page with countdown display and controls.
     """
 
+    # Phase label text and the phase/time label stylesheets per state,
+    # bright colors for dark theme
+    PHASE_STYLES = {
+        TimerState.IDLE: (
+            "IDLE", "color: #808080; font-size: 20px;", "color: #808080; font-size: 80px;"
+        ),
+        TimerState.FOCUS: (
+            "FOCUS", "color: #66BB6A; font-size: 20px;", "color: #66BB6A; font-size: 80px;"
+        ),
+        TimerState.BREAK: (
+            "BREAK", "color: #42A5F5; font-size: 20px;", "color: #42A5F5; font-size: 80px;"
+        ),
+        TimerState.PAUSED: (
+            "PAUSED", "color: #FFA726; font-size: 20px;", "color: #FFA726; font-size: 80px;"
+        ),
+    }
+
+    # Control button styles, scoped by object name
+    BUTTON_QSS = """
+        QPushButton#startBtn, QPushButton#pauseBtn,
+        QPushButton#stopBtn, QPushButton#skipBreakBtn {
+            color: white;
+            border: none;
+            border-radius: 5px;
+            font-size: 14px;
+        }
+        QPushButton#startBtn, QPushButton#pauseBtn, QPushButton#stopBtn {
+            font-weight: bold;
+        }
+        QPushButton#startBtn {
+            background-color: #4CAF50;
+        }
+        QPushButton#startBtn:hover {
+            background-color: #45a049;
+        }
+        QPushButton#startBtn:pressed {
+            background-color: #3d8b40;
+        }
+        QPushButton#pauseBtn {
+            background-color: #FF9800;
+        }
+        QPushButton#pauseBtn:hover {
+            background-color: #e68a00;
+        }
+        QPushButton#stopBtn {
+            background-color: #f44336;
+        }
+        QPushButton#stopBtn:hover {
+            background-color: #da190b;
+        }
+        QPushButton#pauseBtn:disabled, QPushButton#stopBtn:disabled {
+            background-color: #404040;
+            color: #606060;
+        }
+        QPushButton#skipBreakBtn {
+            background-color: #9E9E9E;
+        }
+        QPushButton#skipBreakBtn:hover {
+            background-color: #757575;
+        }
+    """
+
+    # Delay before option checkbox changes are written, so quick toggles
+    # end in a single write
+    OPTIONS_SAVE_DEBOUNCE_MS = 300
+
     def __init__(
         self,
         storage: Storage,
@@ -35,8 +101,23 @@ class TimerPage(QWidget):
         
         # Current settings
         self._groups: List[Group] = []
+        # Group id -> combo index, for restoring the selection
+        self._group_index: Dict[int, int] = {}
         self._current_preset_index = 0
         self._use_custom = False
+        # Phase styles last applied, so unchanged QSS is not re-parsed
+        self._phase_style: Optional[tuple] = None
+        # " / MM:00 " part of the progress text, for the phase length
+        # it was built for
+        self._progress_total = -1
+        self._progress_suffix = ""
+        # Whether the configuration controls are currently enabled
+        self._config_enabled = True
+        
+        self._options_timer = QTimer(self)
+        self._options_timer.setSingleShot(True)
+        self._options_timer.setInterval(self.OPTIONS_SAVE_DEBOUNCE_MS)
+        self._options_timer.timeout.connect(self._save_options)
         
         self._setup_ui()
         self._connect_signals()
@@ -49,32 +130,34 @@ class TimerPage(QWidget):
         layout.setSpacing(20)
         layout.setContentsMargins(30, 30, 30, 30)
 
+        # Both labels get their size from the stylesheet's font-size,
+        # so they can share one bold font
+        bold_font = QFont()
+        bold_font.setBold(True)
+
         # Phase label (FOCUS / BREAK / PAUSED / IDLE)
         self.phase_label = QLabel("IDLE")
         self.phase_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        phase_font = QFont()
-        phase_font.setPointSize(18)
-        phase_font.setBold(True)
-        self.phase_label.setFont(phase_font)
+        self.phase_label.setFont(bold_font)
         self.phase_label.setStyleSheet("color: #808080; font-size: 20px;")
         layout.addWidget(self.phase_label)
 
         # Big countdown display
         self.time_label = QLabel("00:00")
         self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        time_font = QFont()
-        time_font.setPointSize(72)
-        time_font.setBold(True)
-        self.time_label.setFont(time_font)
+        self.time_label.setFont(bold_font)
         self.time_label.setStyleSheet("color: #e0e0e0; font-size: 80px;")
-        self.time_label.setMinimumHeight(120)
-        layout.addWidget(self.time_label)
+        # Sized for the longest countdown (180 min focus), so new digits
+        # only repaint the label
+        self._fix_label_size(self.time_label, "000:00", 120)
+        layout.addWidget(self.time_label, alignment=Qt.AlignmentFlag.AlignHCenter)
 
         # Progress info
         self.progress_label = QLabel("")
         self.progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.progress_label.setStyleSheet("color: #a0a0a0; font-size: 14px;")
-        layout.addWidget(self.progress_label)
+        self._fix_label_size(self.progress_label, "000:00 / 000:00 (000%)")
+        layout.addWidget(self.progress_label, alignment=Qt.AlignmentFlag.AlignHCenter)
 
         # Separator
         line = QFrame()
@@ -98,9 +181,8 @@ class TimerPage(QWidget):
         preset_box = QGroupBox("Preset")
         preset_layout = QVBoxLayout(preset_box)
         self.preset_combo = QComboBox()
-        for preset in DEFAULT_PRESETS:
-            self.preset_combo.addItem(str(preset))
-        self.preset_combo.addItem("Custom")
+        # One bulk insert for every preset plus "Custom"
+        self.preset_combo.addItems([str(preset) for preset in DEFAULT_PRESETS] + ["Custom"])
         self.preset_combo.setMinimumWidth(180)
         preset_layout.addWidget(self.preset_combo)
         config_layout.addWidget(preset_box)
@@ -134,87 +216,31 @@ class TimerPage(QWidget):
         button_layout.setSpacing(15)
 
         self.start_btn = QPushButton("Start Focus")
+        self.start_btn.setObjectName("startBtn")
         self.start_btn.setMinimumSize(120, 45)
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
         button_layout.addWidget(self.start_btn)
 
         self.pause_btn = QPushButton("Pause")
+        self.pause_btn.setObjectName("pauseBtn")
         self.pause_btn.setMinimumSize(100, 45)
         self.pause_btn.setEnabled(False)
-        self.pause_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e68a00;
-            }
-            QPushButton:disabled {
-                background-color: #404040;
-                color: #606060;
-            }
-        """)
         button_layout.addWidget(self.pause_btn)
 
         self.stop_btn = QPushButton("Stop")
+        self.stop_btn.setObjectName("stopBtn")
         self.stop_btn.setMinimumSize(100, 45)
         self.stop_btn.setEnabled(False)
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-            QPushButton:disabled {
-                background-color: #404040;
-                color: #606060;
-            }
-        """)
         button_layout.addWidget(self.stop_btn)
 
         self.skip_break_btn = QPushButton("Skip Break")
+        self.skip_break_btn.setObjectName("skipBreakBtn")
         self.skip_break_btn.setMinimumSize(100, 45)
         self.skip_break_btn.setVisible(False)
-        self.skip_break_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9E9E9E;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #757575;
-            }
-        """)
         button_layout.addWidget(self.skip_break_btn)
 
         layout.addLayout(button_layout)
+        # One sheet for all four buttons, parsed once
+        self.setStyleSheet(self.BUTTON_QSS)
 
         # Options section
         options_layout = QHBoxLayout()
@@ -234,6 +260,25 @@ class TimerPage(QWidget):
         # Spacer
         layout.addStretch()
 
+    def _fix_label_size(self, label: QLabel, longest_text: str, min_height: int = 0):
+        """
+        Fix a label's size to fit its longest text.
+        
+        A label with a fixed size does not invalidate the page layout when
+        its text changes.
+        
+        Args:
+            label: Label to size, with its font and stylesheet already set.
+            longest_text: Longest text the label shows, with 0 for each digit.
+            min_height: Minimum height in pixels.
+        """
+        label.ensurePolished()
+        metrics = label.fontMetrics()
+        # Measure with the widest digit in case the digits are not tabular
+        widest = max("0123456789", key=metrics.horizontalAdvance)
+        width = metrics.horizontalAdvance(longest_text.replace("0", widest))
+        label.setFixedSize(width + 4, max(min_height, metrics.height()))
+
     def _connect_signals(self):
         """Connect widget signals to slots."""
         # Timer engine signals
@@ -254,29 +299,45 @@ class TimerPage(QWidget):
         self.auto_break_check.toggled.connect(self._on_options_changed)
         self.auto_focus_check.toggled.connect(self._on_options_changed)
 
-    def _load_groups(self):
-        """Load groups from storage."""
+    def _load_groups(self, select_id: Optional[int] = None):
+        """
+        Load groups from storage.
+        
+        Args:
+            select_id: Group to reselect, if it still exists.
+        """
         self._groups = self.storage.get_all_groups()
-        self.group_combo.clear()
-        for group in self._groups:
-            self.group_combo.addItem(group.name, group.id)
+        self._group_index = {group.id: i for i, group in enumerate(self._groups)}
+        with QSignalBlocker(self.group_combo):
+            self.group_combo.clear()
+            for group in self._groups:
+                self.group_combo.addItem(group.name, group.id)
+            
+            index = self._group_index.get(select_id)
+            if index is not None:
+                self.group_combo.setCurrentIndex(index)
+        
+        # One update for the final selection instead of one per change
+        self._on_group_changed(self.group_combo.currentIndex())
 
     def _load_settings(self):
         """Load settings from storage."""
         settings = self.storage.get_settings()
-        self.auto_break_check.setChecked(settings.auto_start_break)
-        self.auto_focus_check.setChecked(settings.auto_start_focus)
+        # Values come from storage, so there is nothing to write back
+        with QSignalBlocker(self.auto_break_check):
+            self.auto_break_check.setChecked(settings.auto_start_break)
+        with QSignalBlocker(self.auto_focus_check):
+            self.auto_focus_check.setChecked(settings.auto_start_focus)
 
     def refresh_groups(self):
         """Refresh the groups list (called when groups are modified)."""
-        current_id = self.group_combo.currentData()
-        self._load_groups()
-        
         # Try to reselect the previous group
-        for i in range(self.group_combo.count()):
-            if self.group_combo.itemData(i) == current_id:
-                self.group_combo.setCurrentIndex(i)
-                break
+        self._load_groups(self.group_combo.currentData())
+
+    def flush_options(self):
+        """Save option changes still waiting on the debounce timer."""
+        if self._options_timer.isActive():
+            self._save_options()
 
     def _get_current_timing(self) -> tuple:
         """Get current focus and break minutes based on selection."""
@@ -342,24 +403,37 @@ class TimerPage(QWidget):
     @Slot()
     def _on_options_changed(self):
         """Handle option checkbox changes."""
-        settings = self.storage.get_settings()
-        settings.auto_start_break = self.auto_break_check.isChecked()
-        settings.auto_start_focus = self.auto_focus_check.isChecked()
-        self.storage.save_settings(settings)
+        # (Re)start the countdown; only the final state is saved
+        self._options_timer.start()
+
+    @Slot()
+    def _save_options(self):
+        """Save the option checkboxes to storage."""
+        self._options_timer.stop()
+        # Write just these two, so no read is needed and other settings
+        # saved meanwhile are kept
+        self.storage.update_settings(
+            auto_start_break=self.auto_break_check.isChecked(),
+            auto_start_focus=self.auto_focus_check.isChecked()
+        )
 
     @Slot(TimerContext)
     def _on_tick(self, context: TimerContext):
         """Handle timer tick - update display."""
         self.time_label.setText(context.format_remaining())
         
-        # Update progress label
+        # Update progress label (plain attribute reads, no property calls)
         if context.state != TimerState.IDLE:
-            elapsed_min = context.elapsed_seconds // 60
-            elapsed_sec = context.elapsed_seconds % 60
-            total_min = context.total_seconds // 60
+            total = context.total_seconds
+            if total != self._progress_total:
+                self._progress_suffix = f" / {total // 60}:00 "
+                self._progress_total = total
+            
+            elapsed = total - context.remaining_seconds
+            elapsed_min, elapsed_sec = divmod(elapsed, 60)
+            percentage = elapsed / total * 100.0 if total else 0.0
             self.progress_label.setText(
-                f"{elapsed_min}:{elapsed_sec:02d} / {total_min}:00 "
-                f"({context.progress_percentage:.0f}%)"
+                f"{elapsed_min}:{elapsed_sec:02d}{self._progress_suffix}({percentage:.0f}%)"
             )
         else:
             self.progress_label.setText("")
@@ -367,53 +441,72 @@ class TimerPage(QWidget):
     @Slot(TimerState, TimerState)
     def _on_phase_changed(self, old_state: TimerState, new_state: TimerState):
         """Handle phase change - update UI state."""
-        # Update phase label - bright colors for dark theme
-        phase_colors = {
-            TimerState.IDLE: ("#808080", "IDLE"),
-            TimerState.FOCUS: ("#66BB6A", "FOCUS"),
-            TimerState.BREAK: ("#42A5F5", "BREAK"),
-            TimerState.PAUSED: ("#FFA726", "PAUSED"),
-        }
-        color, text = phase_colors.get(new_state, ("#808080", "IDLE"))
-        self.phase_label.setText(text)
-        self.phase_label.setStyleSheet(f"color: {color}; font-size: 20px;")
-        self.time_label.setStyleSheet(f"color: {color}; font-size: 80px;")
+        # Update phase label
+        style = self.PHASE_STYLES.get(new_state, self.PHASE_STYLES[TimerState.IDLE])
+        if style != self._phase_style:
+            text, phase_qss, time_qss = style
+            self.phase_label.setText(text)
+            self.phase_label.setStyleSheet(phase_qss)
+            self.time_label.setStyleSheet(time_qss)
+            self._phase_style = style
 
         # Update buttons based on state
-        if new_state == TimerState.IDLE:
-            self.start_btn.setEnabled(True)
-            self.start_btn.setText("Start Focus")
-            self.pause_btn.setEnabled(False)
-            self.pause_btn.setText("Pause")
-            self.stop_btn.setEnabled(False)
-            self.skip_break_btn.setVisible(False)
-            self.time_label.setText("00:00")
-            self.progress_label.setText("")
-            # Enable config controls
-            self._set_config_enabled(True)
-            
-        elif new_state == TimerState.FOCUS:
-            self.start_btn.setEnabled(False)
-            self.pause_btn.setEnabled(True)
-            self.pause_btn.setText("Pause")
-            self.stop_btn.setEnabled(True)
-            self.skip_break_btn.setVisible(False)
-            # Disable config controls during focus
-            self._set_config_enabled(False)
-            
-        elif new_state == TimerState.BREAK:
-            self.start_btn.setEnabled(False)
-            self.pause_btn.setEnabled(True)
-            self.pause_btn.setText("Pause")
-            self.stop_btn.setEnabled(True)
-            self.skip_break_btn.setVisible(True)
-            self._set_config_enabled(False)
-            
-        elif new_state == TimerState.PAUSED:
-            self.pause_btn.setText("Resume")
+        enter = self._PHASE_HANDLERS.get(new_state)
+        if enter is not None:
+            enter(self)
+
+    def _enter_idle(self):
+        """Set up the controls for the idle state."""
+        self.start_btn.setEnabled(True)
+        self.start_btn.setText("Start Focus")
+        self.pause_btn.setEnabled(False)
+        self.pause_btn.setText("Pause")
+        self.stop_btn.setEnabled(False)
+        self.skip_break_btn.setVisible(False)
+        self.time_label.setText("00:00")
+        self.progress_label.setText("")
+        # Enable config controls
+        self._set_config_enabled(True)
+
+    def _enter_focus(self):
+        """Set up the controls for a focus session."""
+        self.start_btn.setEnabled(False)
+        self.pause_btn.setEnabled(True)
+        self.pause_btn.setText("Pause")
+        self.stop_btn.setEnabled(True)
+        self.skip_break_btn.setVisible(False)
+        # Disable config controls during focus
+        self._set_config_enabled(False)
+
+    def _enter_break(self):
+        """Set up the controls for a break."""
+        self.start_btn.setEnabled(False)
+        self.pause_btn.setEnabled(True)
+        self.pause_btn.setText("Pause")
+        self.stop_btn.setEnabled(True)
+        self.skip_break_btn.setVisible(True)
+        self._set_config_enabled(False)
+
+    def _enter_paused(self):
+        """Set up the controls for a paused session."""
+        self.pause_btn.setText("Resume")
+
+    # Control setup per state, looked up instead of an if/elif chain
+    _PHASE_HANDLERS = {
+        TimerState.IDLE: _enter_idle,
+        TimerState.FOCUS: _enter_focus,
+        TimerState.BREAK: _enter_break,
+        TimerState.PAUSED: _enter_paused,
+    }
 
     def _set_config_enabled(self, enabled: bool):
         """Enable/disable configuration controls."""
+        # FOCUS <-> PAUSED <-> BREAK keep them disabled; skip the no-op
+        # setEnabled calls and their style updates
+        if enabled == self._config_enabled:
+            return
+        self._config_enabled = enabled
+        
         self.group_combo.setEnabled(enabled)
         self.preset_combo.setEnabled(enabled)
         if enabled and self._use_custom: